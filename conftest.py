@@ -5,6 +5,8 @@ import sys
 
 # Skip loading heavy ML models during testing for speed
 os.environ["SKIP_EMBEDDER"] = "1"
+# Tests must not write compiled blueprints into a developer's cache directory
+os.environ.pop("MIND_BLUEPRINT_CACHE", None)
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
@@ -13,17 +13,89 @@ Evaluates:
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
 import json
+import mmap
+import operator
 import os
 import re
+import shlex
 import subprocess
-from dataclasses import dataclass
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
 from typing import Any, cast
 
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+_JSON_DECODER = json.JSONDecoder()
+# Default settings, so encoded text matches json.dumps() exactly.
+_JSON_ENCODER = json.JSONEncoder()
+# Input files at least this large are parsed from a memory map
+_MMAP_MIN_BYTES = 1 << 20
+# Characters of raw model output kept in a failing case's result
+_PREVIEW_CHARS = 500
+# Brace positions tried before giving up on finding an object in model output
+_MAX_JSON_STARTS = 16
+# A JSON string (possibly cut off) or a brace, for matching an object's braces
+_JSON_BRACE_RE = re.compile(r'"(?:[^"\\]|\\.)*"?|[{}]', re.DOTALL)
+
+_RETRIEVAL_TOKEN_RE = re.compile(r"[a-zA-Z0-9_\-]{3,}")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+# Too common in prompts and canon bibles to say anything about relevance
+_RETRIEVAL_STOPWORDS = frozenset(
+    {
+        "the",
+        "and",
+        "with",
+        "from",
+        "that",
+        "this",
+        "into",
+        "must",
+        "should",
+        "always",
+        "never",
+        "when",
+        "where",
+        "what",
+        "your",
+        "their",
+        "them",
+        "also",
+        "very",
+        "more",
+        "less",
+        "scene",
+        "style",
+        "tone",
+        "output",
+    }
+)
+
+# Keys every beat object must carry (schema.json: beats.items.required)
+_BEAT_REQUIRED_KEYS = ("id", "goal", "conflict")
+_BEAT_REQUIRED_SET = frozenset(_BEAT_REQUIRED_KEYS)
+
+# Object sections and the keys each must carry when present, in report order
+_NESTED_REQUIRED = (
+    ("constraints", ("never_invent",)),
+    ("style", ("tone",)),
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class CaseResult:
     case_id: str
     json_valid: bool
@@ -36,19 +108,86 @@ class CaseResult:
     notes: list[str]
     output_preview: str
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "case_id": self.case_id,
-            "json_valid": self.json_valid,
-            "schema_valid": self.schema_valid,
-            "null_policy_ok": self.null_policy_ok,
-            "canon_consistent": self.canon_consistent,
-            "hallucinated_characters": self.hallucinated_characters,
-            "forbidden_fact_hits": self.forbidden_fact_hits,
-            "has_conflict": self.has_conflict,
-            "notes": self.notes,
-            "output_preview": self.output_preview,
-        }
+
+@dataclass(slots=True, frozen=True)
+class CanonChunk:
+    """A retrievable canon snippet, tokenized and lowercased once at load."""
+
+    source_name: str
+    text: str
+    tokens: frozenset[str]
+    text_lower: str
+    source_lower: str
+
+
+@dataclass(slots=True, frozen=True)
+class CanonIndex:
+    """Canon chunks plus an inverted index from retrieval token to chunk position."""
+
+    chunks: tuple[CanonChunk, ...] = ()
+    postings: dict[str, tuple[int, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, chunks: list[CanonChunk]) -> CanonIndex:
+        postings: dict[str, list[int]] = defaultdict(list)
+        for position, chunk in enumerate(chunks):
+            for token in chunk.tokens:
+                postings[token].append(position)
+        return cls(
+            tuple(chunks),
+            {token: tuple(positions) for token, positions in postings.items()},
+        )
+
+    def overlaps(self, query_tokens: set[str]) -> Counter[int]:
+        """Count shared tokens per chunk, touching only chunks that share any."""
+        get = self.postings.get
+        return Counter(chain.from_iterable(get(token, ()) for token in query_tokens))
+
+
+_CASE_FIELDS = tuple(item.name for item in fields(CaseResult))
+_case_values = operator.attrgetter(*_CASE_FIELDS)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize CaseResult rows for the stdlib encoder; orjson does it natively."""
+    if isinstance(value, CaseResult):
+        return dict(zip(_CASE_FIELDS, _case_values(value)))
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_RESULTS_ENCODER = json.JSONEncoder(indent=2, default=_json_default)
+
+
+def _load_json(path: Path) -> Any:
+    if orjson is not None and path.stat().st_size >= _MMAP_MIN_BYTES:
+        # orjson parses straight out of the mapped pages, with no bytes copy.
+        with path.open("rb") as fp, mmap.mmap(
+            fp.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+    # Both parsers take the raw bytes, so the file is never decoded to str first.
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _object_end(text: str, start: int) -> int:
+    """Return the index just past the brace closing the one at ``start``.
+
+    Braces inside strings are skipped; returns -1 if the object never closes.
+    """
+    depth = 0
+    for match in _JSON_BRACE_RE.finditer(text, start):
+        token = match.group()
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return -1
 
 
 def _extract_json_blob(text: str) -> dict[str, Any] | None:
@@ -56,63 +195,39 @@ def _extract_json_blob(text: str) -> dict[str, Any] | None:
     if not text:
         return None
 
-    try:
-        parsed = json.loads(text)
-        if isinstance(parsed, dict):
-            return cast(dict[str, Any], parsed)
-    except json.JSONDecodeError:
-        pass
-
-    match = re.search(r"\{.*\}", text, flags=re.DOTALL)
-    if match:
-        candidate = match.group(0)
+    if orjson is not None and text[0] == "{" and text[-1] == "}":
+        # Clean output is one bare object, which orjson parses fastest.
         try:
-            parsed = json.loads(candidate)
-            if isinstance(parsed, dict):
-                return cast(dict[str, Any], parsed)
-        except json.JSONDecodeError:
+            return cast(dict[str, Any], orjson.loads(text))
+        except orjson.JSONDecodeError:
             pass
 
+    # Parse only the object that starts at a brace; raw_decode stops at its
+    # closing brace, so a bare object and one followed by prose are both
+    # handled in a single pass. Prose like "{x}" before the real object only
+    # costs a failed attempt, after which the search resumes past its span.
     start = text.find("{")
-    if start == -1:
-        return None
-
-    depth = 0
-    in_string = False
-    escaped = False
-    for index in range(start, len(text)):
-        char = text[index]
-        if escaped:
-            escaped = False
-            continue
-        if char == "\\":
-            escaped = True
-            continue
-        if char == '"':
-            in_string = not in_string
-            continue
-        if in_string:
+    attempts = 0
+    while start != -1 and attempts < _MAX_JSON_STARTS:
+        attempts += 1
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError as exc:
+            end = -1 if exc.pos >= len(text) else _object_end(text, start)
+            if end == -1:
+                # Truncated output; an object nested in it is not the answer
+                return None
+            start = text.find("{", end)
             continue
-        if char == "{":
-            depth += 1
-        elif char == "}":
-            depth -= 1
-            if depth == 0:
-                candidate = text[start : index + 1]
-                try:
-                    parsed = json.loads(candidate)
-                    if isinstance(parsed, dict):
-                        return cast(dict[str, Any], parsed)
-                except json.JSONDecodeError:
-                    return None
-
+        # Decoding from a brace can only yield an object
+        return cast(dict[str, Any], parsed)
     return None
 
 
-def _strip_prompt_echo(output: str, prompt: str) -> tuple[str, list[str]]:
+def _strip_prompt_echo(output: str, stripped_prompt: str) -> tuple[str, list[str]]:
+    """Trim a leading echo of the prompt, which the caller passes pre-stripped."""
     notes: list[str] = []
     stripped_output = output.strip()
-    stripped_prompt = prompt.strip()
 
     if stripped_prompt and stripped_output.startswith(stripped_prompt):
         stripped_output = stripped_output[len(stripped_prompt) :].strip()
@@ -127,35 +242,8 @@ def _strip_prompt_echo(output: str, prompt: str) -> tuple[str, list[str]]:
 def _tokenize_for_retrieval(text: str) -> set[str]:
     return {
         token
-        for token in re.findall(r"[a-zA-Z0-9_\-]{3,}", text.lower())
-        if token
-        not in {
-            "the",
-            "and",
-            "with",
-            "from",
-            "that",
-            "this",
-            "into",
-            "must",
-            "should",
-            "always",
-            "never",
-            "when",
-            "where",
-            "what",
-            "your",
-            "their",
-            "them",
-            "also",
-            "very",
-            "more",
-            "less",
-            "scene",
-            "style",
-            "tone",
-            "output",
-        }
+        for token in _RETRIEVAL_TOKEN_RE.findall(text.lower())
+        if token not in _RETRIEVAL_STOPWORDS
     }
 
 
@@ -187,33 +275,32 @@ def _split_markdown_chunks(text: str) -> list[str]:
         if len(compact) <= 260:
             final_chunks.append(compact)
             continue
-        sentences = re.split(r"(?<=[.!?])\s+", compact)
-        current_sentence = ""
+        sentences = _SENTENCE_SPLIT_RE.split(compact)
+        # Track the joined length instead of rebuilding the text per sentence
+        pending: list[str] = []
+        pending_len = 0
         for sentence in sentences:
             sentence = sentence.strip()
             if not sentence:
                 continue
-            candidate = (
-                f"{current_sentence} {sentence}".strip()
-                if current_sentence
-                else sentence
-            )
-            if len(candidate) > 260 and current_sentence:
-                final_chunks.append(current_sentence)
-                current_sentence = sentence
+            if pending and pending_len + 1 + len(sentence) > 260:
+                final_chunks.append(" ".join(pending))
+                pending = [sentence]
+                pending_len = len(sentence)
             else:
-                current_sentence = candidate
-        if current_sentence:
-            final_chunks.append(current_sentence)
+                pending_len += len(sentence) + (1 if pending else 0)
+                pending.append(sentence)
+        if pending:
+            final_chunks.append(" ".join(pending))
 
     return [chunk for chunk in final_chunks if chunk]
 
 
-def _load_canon_chunks(canon_dir: Path) -> list[tuple[str, str]]:
+def _load_canon_chunks(canon_dir: Path) -> list[CanonChunk]:
     if not canon_dir.exists() or not canon_dir.is_dir():
         return []
 
-    chunks: list[tuple[str, str]] = []
+    chunks: list[CanonChunk] = []
     for path in sorted(canon_dir.glob("*.md")):
         if path.name.lower() == "readme.md":
             continue
@@ -223,19 +310,27 @@ def _load_canon_chunks(canon_dir: Path) -> list[tuple[str, str]]:
         for chunk in _split_markdown_chunks(content):
             cleaned = chunk.strip()
             if cleaned:
-                chunks.append((path.name, cleaned))
+                chunks.append(
+                    CanonChunk(
+                        source_name=path.name,
+                        text=cleaned,
+                        tokens=frozenset(_tokenize_for_retrieval(cleaned)),
+                        text_lower=cleaned.lower(),
+                        source_lower=path.name.lower(),
+                    )
+                )
 
     return chunks
 
 
 def _retrieve_canon_context(
     case: dict[str, Any],
-    canon_chunks: list[tuple[str, str]],
+    canon_index: CanonIndex,
     top_k: int,
     max_chars: int,
     min_overlap: int,
 ) -> str:
-    if not canon_chunks or top_k <= 0 or max_chars <= 0:
+    if not canon_index.chunks or top_k <= 0 or max_chars <= 0:
         return ""
 
     query_parts = [str(case.get("input", ""))]
@@ -251,26 +346,22 @@ def _retrieve_canon_context(
         return ""
 
     scored: list[tuple[int, str, str]] = []
-    canon_names = {
-        value.strip().lower()
-        for value in case.get("canon_characters", [])
-        if isinstance(value, str) and value.strip()
-    }
-    for source_name, chunk in canon_chunks:
-        chunk_tokens = _tokenize_for_retrieval(chunk)
-        overlap = len(query_tokens.intersection(chunk_tokens))
-        if overlap < max(min_overlap, 1):
-            continue
-        bonus = 0
-        for name in case.get("canon_characters", []):
-            if isinstance(name, str) and name.strip() and name.lower() in chunk.lower():
-                bonus += 2
-        source_lower = source_name.lower()
+    canon_names = case["_canon_lower"]
+    bonus_names = case["_canon_bonus_lower"]
+    overlaps = canon_index.overlaps(query_tokens)
+    threshold = max(min_overlap, 1)
+    # Sorted so chunks are scored, and ties kept, in load order
+    for position in sorted(p for p, count in overlaps.items() if count >= threshold):
+        chunk = canon_index.chunks[position]
+        overlap = overlaps[position]
+        text_lower = chunk.text_lower
+        bonus = 2 * sum(1 for name in bonus_names if name in text_lower)
+        source_lower = chunk.source_lower
         if any(name in source_lower for name in canon_names):
             bonus += 3
         if "environment" in source_lower:
             bonus -= 1
-        scored.append((overlap + bonus, source_name, chunk))
+        scored.append((overlap + bonus, chunk.source_name, chunk.text))
 
     if not scored:
         return ""
@@ -298,28 +389,31 @@ def _retrieve_canon_context(
     return "\n".join(selected).strip()
 
 
+_CONFLICT_CUES = (
+    "but",
+    "however",
+    "except",
+    "versus",
+    "vs",
+    "tension",
+    "conflict",
+    "contradiction",
+    "yet",
+    "although",
+)
+
+
 def _implied_conflict_from_input(case: dict[str, Any]) -> str | None:
     raw_input = case.get("input")
     if not isinstance(raw_input, str):
         return None
     lowered = raw_input.lower()
-    cues = [
-        "but",
-        "however",
-        "except",
-        "versus",
-        "vs",
-        "tension",
-        "conflict",
-        "contradiction",
-        "yet",
-        "although",
-    ]
-    if any(cue in lowered for cue in cues):
+    if any(cue in lowered for cue in _CONFLICT_CUES):
         return "implied tension"
     return None
 
 
+@functools.lru_cache(maxsize=4)
 def _load_prompt_template(prompt_file: str | None = None) -> str:
     """Load prompt from file, default to minimal prompt."""
     if prompt_file is None:
@@ -333,13 +427,66 @@ def _load_prompt_template(prompt_file: str | None = None) -> str:
     return "Return valid JSON only."
 
 
+_PROMPT_PLACEHOLDERS = (
+    "{ALLOW_INVENTION}",
+    "{CANON_CHARACTERS}",
+    "{CANON_FACTS}",
+    "{RAG_CONTEXT}",
+    "{INPUT}",
+)
+# Each fill pass finds its placeholders in one scan instead of chained replaces
+_CANON_PLACEHOLDER_RE = re.compile(
+    r"\{(ALLOW_INVENTION|CANON_CHARACTERS|CANON_FACTS)\}"
+)
+_CASE_PLACEHOLDER_RE = re.compile(r"\{(RAG_CONTEXT|INPUT)\}")
+
+
+@functools.lru_cache(maxsize=8)
+def _split_prompt_template(template: str) -> tuple[str, str]:
+    """Split a template into its constant prefix and the placeholder-bearing rest."""
+    cut = min(
+        (template.find(p) for p in _PROMPT_PLACEHOLDERS if p in template),
+        default=len(template),
+    )
+    return template[:cut], template[cut:]
+
+
+def _is_str_sequence(value: Any) -> bool:
+    return isinstance(value, (list, tuple)) and all(
+        isinstance(item, str) for item in value
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _fill_canon_placeholders(
+    template: str,
+    allow_invention: bool,
+    canon_characters: Any,
+    canon_facts: Any,
+) -> str:
+    """Fill the canon placeholders, which many cases share verbatim.
+
+    Only call the cached function with tuples of strings, whose hashes and
+    JSON encodings agree; anything else goes through ``__wrapped__``.
+    """
+    values = {
+        "ALLOW_INVENTION": str(allow_invention).lower(),
+        "CANON_CHARACTERS": _JSON_ENCODER.encode(canon_characters),
+        "CANON_FACTS": _JSON_ENCODER.encode(canon_facts),
+    }
+    return _CANON_PLACEHOLDER_RE.sub(lambda match: values[match[1]], template)
+
+
 def _prompt_for_case(
     case: dict[str, Any],
     schema: dict[str, Any],
     rag_context: str = "",
     prompt_template: str = "",
-) -> str:
-    """Build prompt from template with case-specific variables."""
+) -> tuple[str, str]:
+    """Build prompt from template with case-specific variables.
+
+    Returns the prompt and its stripped form for prompt-echo detection.
+    """
     canon_characters = case.get("canon_characters", [])
     canon_facts = case.get("canon_facts", [])
     allow_invention = bool(case.get("allow_invention", False))
@@ -352,40 +499,264 @@ def _prompt_for_case(
     # Fill placeholder variables in template
     rag_section = f"Retrieved canon:\n{rag_context}\n\n" if rag_context.strip() else ""
 
-    filled_template = (
-        prompt_template.replace("{ALLOW_INVENTION}", str(allow_invention).lower())
-        .replace("{CANON_CHARACTERS}", json.dumps(canon_characters))
-        .replace("{CANON_FACTS}", json.dumps(canon_facts))
-        .replace("{RAG_CONTEXT}", rag_section.strip())
-        .replace("{INPUT}", user_input)
+    # The rules preamble is identical for every case; only fill the rest.
+    prefix, variable_part = _split_prompt_template(prompt_template)
+    if _is_str_sequence(canon_characters) and _is_str_sequence(canon_facts):
+        canon_part = _fill_canon_placeholders(
+            variable_part, allow_invention, tuple(canon_characters), tuple(canon_facts)
+        )
+    else:
+        # Other values could split (a string) or collide (True and 1) as keys
+        canon_part = _fill_canon_placeholders.__wrapped__(
+            variable_part, allow_invention, canon_characters, canon_facts
+        )
+    values = {"RAG_CONTEXT": rag_section.strip(), "INPUT": user_input}
+    filled_template = prefix + _CASE_PLACEHOLDER_RE.sub(
+        lambda match: values[match[1]], canon_part
     )
 
-    return filled_template
+    return filled_template, filled_template.strip()
+
+
+class _LlamaServer:
+    """Run ``llama-server`` for the duration of a ``with`` block.
+
+    The model is loaded once and every case is sent to it over HTTP instead
+    of starting a llama process per prompt. Entering yields the base URL.
+    """
+
+    def __init__(
+        self,
+        server_bin: str,
+        model_file: str,
+        port: int,
+        startup_timeout: float,
+        parallel: int = 1,
+    ) -> None:
+        self.command = [
+            server_bin,
+            "-m",
+            model_file,
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+        ]
+        if parallel > 1:
+            # One decoding slot per in-flight request, batched together
+            self.command += ["--parallel", str(parallel), "--cont-batching"]
+        self.url = f"http://127.0.0.1:{port}"
+        self.startup_timeout = startup_timeout
+        self._proc: subprocess.Popen[bytes] | None = None
+
+    def __enter__(self) -> str:
+        self._proc = subprocess.Popen(
+            self.command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            code = self._proc.poll()
+            if code is not None:
+                raise RuntimeError(f"llama-server exited with code {code}")
+            try:
+                # /health answers 503 until the model has finished loading
+                with urllib.request.urlopen(f"{self.url}/health", timeout=1):
+                    return self.url
+            except OSError:
+                pass
+            if time.monotonic() > deadline:
+                self.close()
+                raise RuntimeError(
+                    f"llama-server not ready after {self.startup_timeout}s"
+                )
+            time.sleep(0.25)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._proc is None:
+            return
+        self._proc.terminate()
+        try:
+            self._proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        self._proc = None
 
 
-def _run_phi(prompt: str, args: argparse.Namespace) -> tuple[str, list[str]]:
+def _run_phi_server(
+    prompt: str,
+    stripped_prompt: str,
+    args: argparse.Namespace,
+    n_predict: int,
+    temperature: float,
+) -> tuple[str, list[str]]:
+    """Complete the prompt against a running llama-server, keeping the model loaded."""
+    payload = {
+        "prompt": prompt,
+        "n_predict": n_predict,
+        "temperature": temperature,
+        # Reuse the KV cache for the rules preamble every prompt shares
+        "cache_prompt": True,
+    }
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = _JSON_ENCODER.encode(payload).encode("utf-8")
+    request = urllib.request.Request(
+        f"{args.server_url.rstrip('/')}/completion",
+        data=body,
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=args.timeout) as response:
+            raw = response.read()
+        reply = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        content = reply.get("content", "")
+    except TimeoutError:
+        return "", [f"invocation_timeout:{args.timeout}s"]
+    except urllib.error.HTTPError as exc:
+        return "", [f"llama_failed: HTTP {exc.code}"]
+    except urllib.error.URLError as exc:
+        if isinstance(exc.reason, TimeoutError):
+            return "", [f"invocation_timeout:{args.timeout}s"]
+        return "", [f"invocation_error: {exc.reason}"]
+    except Exception as exc:  # pylint: disable=broad-except
+        return "", [f"invocation_error: {exc}"]
+
+    return _strip_prompt_echo(str(content), stripped_prompt)
+
+
+def _decode_output(data: bytes) -> str:
+    # Same text as subprocess's text=True: UTF-8 with universal newlines
+    text = data.decode("utf-8", errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+@functools.lru_cache(maxsize=4)
+def _split_command_template(template: str) -> tuple[str, ...]:
+    return tuple(shlex.split(template))
+
+
+def _drain_pipe(
+    pipe: Any, buffer: bytearray, max_bytes: int, full: threading.Event | None
+) -> None:
+    """Read ``pipe`` into ``buffer`` until EOF, keeping at most ``max_bytes``.
+
+    With ``full`` given, stops reading and sets it once the cap is reached;
+    otherwise bytes past the cap are drained but dropped. The pipe is closed
+    on return, so no other thread closes it under a pending read.
+    """
+    with pipe:
+        while chunk := os.read(pipe.fileno(), 65536):
+            buffer += chunk[: max_bytes - len(buffer)]
+            if full is not None and len(buffer) >= max_bytes:
+                full.set()
+                return
+
+
+def _run_capped(
+    command: list[str], timeout: float, max_bytes: int
+) -> tuple[subprocess.CompletedProcess[str], bool]:
+    """Run a command, keeping at most ``max_bytes`` of stdout and of stderr.
+
+    A runaway generation is killed once stdout reaches the cap instead of
+    being buffered whole. Returns the finished process and whether stdout was
+    capped; raises ``subprocess.TimeoutExpired`` like ``subprocess.run``.
+    The pipes are read on threads, so this works wherever ``subprocess`` does.
+    """
+    proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert proc.stdout is not None and proc.stderr is not None
+    deadline = time.monotonic() + timeout
+    stdout, stderr = bytearray(), bytearray()
+    full = threading.Event()
+    readers = [
+        threading.Thread(
+            target=_drain_pipe, args=(proc.stdout, stdout, max_bytes, full)
+        ),
+        threading.Thread(
+            target=_drain_pipe, args=(proc.stderr, stderr, max_bytes, None)
+        ),
+    ]
+    for reader in readers:
+        reader.daemon = True
+        reader.start()
+    try:
+        # The stdout reader returns at EOF (normally process exit) or the cap
+        readers[0].join(timeout)
+        if readers[0].is_alive():
+            raise subprocess.TimeoutExpired(command, timeout)
+        if full.is_set():
+            proc.kill()
+        proc.wait(timeout=max(deadline - time.monotonic(), 0))
+    except subprocess.TimeoutExpired:
+        raise subprocess.TimeoutExpired(command, timeout) from None
+    finally:
+        # Also covers KeyboardInterrupt and anything else raised above
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        for reader in readers:
+            # A grandchild still holding the pipes must not hang the run; a
+            # reader left waiting on one closes its pipe when it finishes.
+            reader.join(1.0)
+
+    result = subprocess.CompletedProcess(
+        command,
+        proc.returncode,
+        _decode_output(bytes(stdout)),
+        _decode_output(bytes(stderr)),
+    )
+    return result, full.is_set()
+
+
+def _run_phi(
+    prompt: str,
+    args: argparse.Namespace,
+    stripped_prompt: str | None = None,
+    *,
+    n_predict: int | None = None,
+    temperature: float | None = None,
+) -> tuple[str, list[str]]:
+    """Run the model on a prompt; n_predict/temperature override the CLI values."""
     notes: list[str] = []
+    if stripped_prompt is None:
+        stripped_prompt = prompt.strip()
+    if n_predict is None:
+        n_predict = args.n_predict
+    if temperature is None:
+        temperature = args.temperature
 
     if args.dry_run:
         return "{}", ["dry_run_enabled"]
 
     if args.command_template:
-        command_str = args.command_template.format(prompt=prompt)
+        # The prompt becomes one argv entry, so no shell ever parses it
+        command_argv = [
+            token.format(prompt=prompt)
+            for token in _split_command_template(args.command_template)
+        ]
         try:
-            proc = subprocess.run(
-                command_str,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=args.timeout,
+            proc, capped = _run_capped(
+                command_argv, args.timeout, args.max_output_bytes
             )
         except subprocess.TimeoutExpired:
             return "", [f"invocation_timeout:{args.timeout}s"]
-        if proc.returncode != 0:
+        except OSError as exc:
+            # e.g. the program is not found, which a shell used to report
+            return "", [f"command_failed: {exc}"]
+        if capped:
+            notes.append(f"output_capped:{args.max_output_bytes}B")
+        elif proc.returncode != 0:
             return "", [f"command_failed: {proc.stderr.strip()}"]
-        output, trim_notes = _strip_prompt_echo(proc.stdout, prompt)
+        output, trim_notes = _strip_prompt_echo(proc.stdout, stripped_prompt)
         return output, notes + trim_notes
 
+    if args.server_url:
+        return _run_phi_server(prompt, stripped_prompt, args, n_predict, temperature)
+
     llama_bin = args.llama_bin
     model_file = args.model_file
     if not llama_bin or not model_file:
@@ -398,128 +769,197 @@ def _run_phi(prompt: str, args: argparse.Namespace) -> tuple[str, list[str]]:
         "-p",
         prompt,
         "-n",
-        str(args.n_predict),
+        str(n_predict),
         "--temp",
-        str(args.temperature),
+        str(temperature),
     ]
 
     try:
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            timeout=args.timeout,
-        )
+        proc, capped = _run_capped(command, args.timeout, args.max_output_bytes)
     except subprocess.TimeoutExpired:
         return "", [f"invocation_timeout:{args.timeout}s"]
     except Exception as exc:  # pylint: disable=broad-except
         return "", [f"invocation_error: {exc}"]
 
-    if proc.returncode != 0:
+    if capped:
+        notes.append(f"output_capped:{args.max_output_bytes}B")
+    elif proc.returncode != 0:
         return "", [f"llama_failed: {proc.stderr.strip()}"]
 
-    output, trim_notes = _strip_prompt_echo(proc.stdout, prompt)
+    output, trim_notes = _strip_prompt_echo(proc.stdout, stripped_prompt)
     return output, notes + trim_notes
 
 
 def _validate_required_fields(
-    payload: dict[str, Any], schema: dict[str, Any]
-) -> tuple[bool, list[str]]:
+    payload: dict[str, Any],
+    required_top: tuple[str, ...],
+    required_set: frozenset[str],
+) -> tuple[bool, bool, list[str]]:
+    """Check schema compliance and the null-fill policy in one pass.
+
+    ``required_top`` keeps the schema order for notes; ``required_set`` is the
+    same keys for the subset test. Returns ``(schema_valid, null_policy_ok,
+    notes)``.
+    """
     notes: list[str] = []
-    required_top = schema.get("required", [])
-    for key in required_top:
-        if key not in payload:
-            notes.append(f"missing_top:{key}")
-
+    append = notes.append
+    missing_top: list[str] = []
+    # Usually every key is present, which one C-level subset test confirms.
+    if not payload.keys() >= required_set:
+        missing_top = [key for key in required_top if key not in payload]
+    for key in missing_top:
+        append(f"missing_top:{key}")
+
+    # The payload comes straight from a JSON decoder, so exact type checks
+    # are enough and skip isinstance's subclass machinery.
     entities = cast(Any, payload.get("entities"))
-    if entities is not None and not isinstance(entities, list):
-        notes.append("invalid_type:entities:expected_array")
-    elif isinstance(entities, list) and not entities:
-        notes.append("empty_entities")
+    if entities is not None and type(entities) is not list:
+        append("invalid_type:entities:expected_array")
+    elif entities == []:
+        append("empty_entities")
 
     beats = cast(Any, payload.get("beats"))
-    if beats is not None and not isinstance(beats, list):
-        notes.append("invalid_type:beats:expected_array")
-    elif isinstance(beats, list):
+    if beats is not None and type(beats) is not list:
+        append("invalid_type:beats:expected_array")
+    elif beats is not None:
         if not beats:
-            notes.append("empty_beats")
+            append("empty_beats")
         for index, beat in enumerate(beats):  # type: ignore[misc]
-            if not isinstance(beat, dict):
-                notes.append(f"invalid_type:beats[{index}]:expected_object")
+            if type(beat) is not dict:
+                append(f"invalid_type:beats[{index}]:expected_object")
+                continue
+            if beat.keys() >= _BEAT_REQUIRED_SET:
                 continue
-            for key in ["id", "goal", "conflict"]:
+            for key in _BEAT_REQUIRED_KEYS:
                 if key not in beat:
-                    notes.append(f"missing_nested:beats[{index}].{key}")
+                    append(f"missing_nested:beats[{index}].{key}")
 
-    constraints = payload.get("constraints")
-    if constraints is not None and not isinstance(constraints, dict):
-        notes.append("invalid_type:constraints:expected_object")
-    elif isinstance(constraints, dict) and "never_invent" not in constraints:
-        notes.append("missing_nested:constraints.never_invent")
+    for section, required in _NESTED_REQUIRED:
+        value = payload.get(section)
+        if value is None:
+            continue
+        if type(value) is not dict:
+            append(f"invalid_type:{section}:expected_object")
+            continue
+        for key in required:
+            if key not in value:
+                append(f"missing_nested:{section}.{key}")
 
-    style = payload.get("style")
-    if style is not None and not isinstance(style, dict):
-        notes.append("invalid_type:style:expected_object")
-    elif isinstance(style, dict) and "tone" not in style:
-        notes.append("missing_nested:style.tone")
+    schema_valid = not notes
+    # Unknowns must be filled with null, so a missing required key also
+    # breaks the null policy.
+    for key in missing_top:
+        append(f"required_key_missing:{key}")
 
-    return len(notes) == 0, notes
+    return schema_valid, not missing_top, notes
 
 
-def _check_null_policy(
-    payload: dict[str, Any], schema: dict[str, Any]
-) -> tuple[bool, list[str]]:
-    notes: list[str] = []
-    required_top = schema.get("required", [])
-    for key in required_top:
-        if key not in payload:
-            notes.append(f"required_key_missing:{key}")
+def _collect_entity_names(
+    payload: dict[str, Any], known: frozenset[str] = frozenset()
+) -> set[str]:
+    """Return the lowercased entity names in the payload that are not in known."""
+    names: set[str] = set()
+    add = names.add
 
-    return len(notes) == 0, notes
+    for item in payload.get("entities") or ():
+        if type(item) is dict:
+            item = cast(Any, item.get("name"))  # type: ignore[misc]
+        if type(item) is str:
+            name = item.strip().lower()
+            if name and name not in known:
+                add(name)
 
+    return names
 
-def _collect_entity_names(payload: dict[str, Any]) -> set[str]:
-    names: set[str] = set()
 
-    entities_list = payload.get("entities", [])
-    for item in entities_list:
-        if isinstance(item, str) and item.strip():
-            names.add(item.strip().lower())
-        if isinstance(item, dict):
-            raw_name = cast(Any, item.get("name"))  # type: ignore[misc]
-            if isinstance(raw_name, str) and raw_name.strip():
-                names.add(raw_name.strip().lower())
+def _iter_string_leaves(value: Any) -> Any:
+    """Yield every dict key and scalar in a JSON payload as text, depth first."""
+    # An explicit stack instead of recursion: nested ``yield from`` chains
+    # cost a frame hop per level for every leaf.
+    stack = [value]
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        item = pop()
+        kind = type(item)
+        if kind is str:
+            yield item
+        elif kind is dict:
+            # Reversed so keys and values pop back off in document order
+            for key, child in reversed(item.items()):
+                push((child, str(key)))
+        elif kind is list:
+            push(reversed(item))
+        else:
+            yield _JSON_ENCODER.encode(item)
 
-    return names
+
+def _prepare_case(case: dict[str, Any]) -> dict[str, Any]:
+    """Attach the normalized fields the checks read, computed once per case."""
+    case["_allow_invention"] = bool(case.get("allow_invention", False))
+    case["_implied_conflict"] = _implied_conflict_from_input(case)
+    case["_canon_names"] = tuple(
+        value.strip()
+        for value in case.get("canon_characters", [])
+        if isinstance(value, str) and value.strip()
+    )
+    case["_canon_lower"] = frozenset(name.lower() for name in case["_canon_names"])
+    # Unstripped and with repeats, as the retrieval bonus counts each entry
+    case["_canon_bonus_lower"] = tuple(
+        value.lower()
+        for value in case.get("canon_characters", [])
+        if isinstance(value, str) and value.strip()
+    )
+    case["_forbidden_lower"] = tuple(
+        (fact, fact.strip().lower())
+        for fact in case.get("forbidden_facts", [])
+        if isinstance(fact, str) and fact.strip()
+    )
+    forbidden = case["_forbidden_lower"]
+    case["_forbidden_re"] = (
+        re.compile("|".join(re.escape(lowered) for _, lowered in forbidden))
+        if forbidden
+        else None
+    )
+    return case
 
 
 def _check_canon(
     payload: dict[str, Any], case: dict[str, Any]
 ) -> tuple[bool, int, int, list[str]]:
-    notes: list[str] = []
-
-    canon_characters = {
-        value.strip().lower()
-        for value in case.get("canon_characters", [])
-        if isinstance(value, str) and value.strip()
-    }
-    allow_invention = bool(case.get("allow_invention", False))
+    canon_characters = case["_canon_lower"]
+    forbidden_facts = case["_forbidden_lower"]
+    check_entities = bool(canon_characters) and not case["_allow_invention"]
+    if not forbidden_facts and not check_entities:
+        return True, 0, 0, []
 
-    output_text = json.dumps(payload, ensure_ascii=False).lower()
+    notes: list[str] = []
     forbidden_hits = 0
-    for fact in case.get("forbidden_facts", []):
-        if (
-            isinstance(fact, str)
-            and fact.strip()
-            and fact.strip().lower() in output_text
-        ):
-            forbidden_hits += 1
-            notes.append(f"forbidden_fact:{fact}")
+    if forbidden_facts:
+        # Each value is scanned on its own, so a fact never matches across two
+        # values and the payload is never copied into one big string. One
+        # alternation search rules out the usual no-hit value; matches do not
+        # overlap, so on a hit each fact is still checked on its own.
+        search = case["_forbidden_re"].search
+        found: set[int] = set()
+        for leaf in _iter_string_leaves(payload):
+            text = leaf.lower()
+            if search(text):
+                found.update(
+                    index
+                    for index, (_, lowered) in enumerate(forbidden_facts)
+                    if lowered in text
+                )
+                if len(found) == len(forbidden_facts):
+                    break
+        for index, (fact, _) in enumerate(forbidden_facts):
+            if index in found:
+                forbidden_hits += 1
+                notes.append(f"forbidden_fact:{fact}")
 
     hallucinated = 0
-    if canon_characters and not allow_invention:
-        found = _collect_entity_names(payload)
-        unknown = sorted(name for name in found if name not in canon_characters)
+    if check_entities:
+        unknown = sorted(_collect_entity_names(payload, canon_characters))
         hallucinated = len(unknown)
         if unknown:
             notes.append(f"hallucinated_characters:{unknown}")
@@ -549,40 +989,86 @@ def _check_conflict(payload: dict[str, Any]) -> tuple[bool, list[str]]:
     return True, notes
 
 
-def _to_rate(values: list[bool]) -> float:
-    if not values:
-        return 0.0
-    return round(sum(1 for value in values if value) / len(values), 4)
+# Summary rate name -> the CaseResult flag it averages, in report order
+_FLAG_RATES = (
+    ("json_valid_rate", "json_valid"),
+    ("schema_valid_rate", "schema_valid"),
+    ("null_policy_rate", "null_policy_ok"),
+    ("canon_consistency_rate", "canon_consistent"),
+    ("conflict_extraction_rate", "has_conflict"),
+)
+_flag_values = operator.attrgetter(*(field for _, field in _FLAG_RATES))
 
 
-def _note_rate(results: list[CaseResult], prefix: str) -> float:
+def _flag_rates(results: list[CaseResult]) -> dict[str, float]:
+    """Average every boolean flag over the results in one pass."""
     if not results:
-        return 0.0
-    hit_count = sum(
-        1 for item in results if any(note.startswith(prefix) for note in item.notes)
-    )
-    return round(hit_count / len(results), 4)
+        return {name: 0.0 for name, _ in _FLAG_RATES}
+    # Transposing the per-case flag tuples lets sum() count each column in C.
+    totals = map(sum, zip(*map(_flag_values, results)))
+    return {
+        name: round(total / len(results), 4)
+        for (name, _), total in zip(_FLAG_RATES, totals)
+    }
 
 
-def _repair_json_output(
-    raw_output: str,
-    schema: dict[str, Any],
-    args: argparse.Namespace,
-) -> tuple[dict[str, Any] | None, list[str]]:
-    required_top = schema.get("required", [])
-    repair_prompt = (
+# Summary rate name -> the note prefix whose cases it counts, in report order
+_NOTE_RATES = (
+    ("invocation_timeout_rate", "invocation_timeout:"),
+    ("invocation_error_rate", "invocation_error:"),
+    ("prompt_echo_rate", "prompt_echo"),
+    ("repair_success_rate", "repaired_json_success"),
+)
+_NOTE_PREFIXES = tuple(prefix for _, prefix in _NOTE_RATES)
+
+
+def _note_rates(results: list[CaseResult]) -> dict[str, float]:
+    """Share of cases carrying each note prefix, from one sweep over the notes."""
+    if not results:
+        return {name: 0.0 for name, _ in _NOTE_RATES}
+    hits = [0] * len(_NOTE_PREFIXES)
+    for item in results:
+        seen = 0
+        for note in item.notes:
+            # Most notes match no prefix; the tuple form rejects them in one call.
+            if not note.startswith(_NOTE_PREFIXES):
+                continue
+            for index, prefix in enumerate(_NOTE_PREFIXES):
+                if note.startswith(prefix):
+                    seen |= 1 << index
+        for index in range(len(hits)):
+            if seen & (1 << index):
+                hits[index] += 1
+    return {
+        name: round(count / len(results), 4)
+        for (name, _), count in zip(_NOTE_RATES, hits)
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _repair_prompt_header(required_top: tuple[str, ...]) -> str:
+    """Everything in the repair prompt that comes before the broken output."""
+    return (
         "You are a JSON repair assistant. Convert the content into one valid JSON object only.\n"
         "Do not add markdown or explanations.\n"
-        f"Required top-level keys: {json.dumps(required_top)}\n\n"
+        f"Required top-level keys: {_JSON_ENCODER.encode(list(required_top))}\n\n"
         "Content to repair:\n"
-        f"{raw_output}\n"
     )
 
-    repair_args = argparse.Namespace(**vars(args))
-    repair_args.n_predict = max(int(args.n_predict), 320)
-    repair_args.temperature = 0.1
 
-    repaired_output, repair_notes = _run_phi(repair_prompt, repair_args)
+def _repair_json_output(
+    raw_output: str,
+    required_top: tuple[str, ...],
+    args: argparse.Namespace,
+) -> tuple[dict[str, Any] | None, list[str]]:
+    repair_prompt = f"{_repair_prompt_header(required_top)}{raw_output}\n"
+
+    repaired_output, repair_notes = _run_phi(
+        repair_prompt,
+        args,
+        n_predict=max(int(args.n_predict), 320),
+        temperature=0.1,
+    )
     repaired_payload = _extract_json_blob(repaired_output)
     if repaired_payload is None:
         return None, repair_notes + ["repair_failed"]
@@ -664,6 +1150,126 @@ def _build_diagnosis(summary: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def _evaluate_case(
+    case: dict[str, Any],
+    args: argparse.Namespace,
+    schema_data: dict[str, Any],
+    canon_index: CanonIndex,
+    prompt_template: str,
+    required_top: tuple[str, ...],
+    required_set: frozenset[str],
+) -> CaseResult:
+    case_id = str(case.get("id", "unknown"))
+    notes: list[str] = []
+
+    rag_context = _retrieve_canon_context(
+        case,
+        canon_index,
+        top_k=int(args.rag_top_k),
+        max_chars=int(args.rag_max_chars),
+        min_overlap=int(args.rag_min_overlap),
+    )
+    prompt, stripped_prompt = _prompt_for_case(
+        case, schema_data, rag_context=rag_context, prompt_template=prompt_template
+    )
+    raw_output, invoke_notes = _run_phi(prompt, args, stripped_prompt)
+    notes.extend(invoke_notes)
+
+    payload = _extract_json_blob(raw_output)
+    json_valid = payload is not None
+
+    schema_valid = False
+    null_ok = False
+    canon_ok = False
+    hallucinated = 0
+    forbidden_hits = 0
+    has_conflict = False
+
+    if (
+        not json_valid
+        and raw_output
+        and not any(note.startswith("invocation_timeout:") for note in notes)
+    ):
+        repaired_payload, repair_notes = _repair_json_output(
+            raw_output,
+            required_top,
+            args,
+        )
+        notes.extend(repair_notes)
+        if repaired_payload is not None:
+            payload = repaired_payload
+            json_valid = True
+
+    # Only the preview outlives parsing and repair; drop the full output so a
+    # long generation is not held through the checks below.
+    preview = raw_output[:_PREVIEW_CHARS]
+    del raw_output
+
+    if json_valid and payload is not None:
+        canon_characters = case["_canon_names"]
+        if canon_characters and not case["_allow_invention"]:
+            canon_lookup = case["_canon_lower"]
+            entities = payload.get("entities")
+            if isinstance(entities, list):
+                filtered_entities = []
+                for entity in entities:
+                    if (
+                        isinstance(entity, str)
+                        and entity.strip().lower() in canon_lookup
+                    ):
+                        filtered_entities.append(entity)
+                if filtered_entities != entities:
+                    payload["entities"] = filtered_entities
+                    notes.append("entities_clamped_to_canon")
+                if not payload.get("entities"):
+                    payload["entities"] = [canon_characters[0]]
+                    notes.append("entities_defaulted_to_primary_canon")
+
+        schema_valid, null_ok, schema_notes = _validate_required_fields(
+            payload, required_top, required_set
+        )
+        notes.extend(schema_notes)
+
+        canon_ok, hallucinated, forbidden_hits, canon_notes = _check_canon(
+            payload, case
+        )
+        notes.extend(canon_notes)
+
+        implied_conflict = case["_implied_conflict"]
+        if implied_conflict:
+            beats = payload.get("beats")
+            if isinstance(beats, list) and beats:
+                first_beat = beats[0]
+                if isinstance(first_beat, dict):
+                    conflict_value = first_beat.get("conflict")
+                    if not (isinstance(conflict_value, str) and conflict_value.strip()):
+                        first_beat["conflict"] = implied_conflict
+                        notes.append("conflict_autofilled")
+
+        has_conflict, conflict_notes = _check_conflict(payload)
+        notes.extend(conflict_notes)
+    else:
+        notes.append("invalid_json")
+
+    return CaseResult(
+        case_id=case_id,
+        json_valid=json_valid,
+        schema_valid=schema_valid,
+        null_policy_ok=null_ok,
+        canon_consistent=canon_ok,
+        hallucinated_characters=hallucinated,
+        forbidden_fact_hits=forbidden_hits,
+        has_conflict=has_conflict,
+        notes=notes,
+        # Passing cases need no raw output to debug, so only failures keep it.
+        output_preview=(
+            ""
+            if json_valid and schema_valid and canon_ok and has_conflict
+            else preview
+        ),
+    )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run phi encoder behavior tests")
     parser.add_argument(
@@ -691,6 +1297,26 @@ def main() -> None:
     parser.add_argument("--n-predict", type=int, default=320)
     parser.add_argument("--temperature", type=float, default=0.3)
     parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument(
+        "--max-output-bytes",
+        type=int,
+        default=256 * 1024,
+        help="Stop a llama/command run once it has printed this many bytes",
+    )
+    parser.add_argument(
+        "--max-workers",
+        "--workers",
+        type=int,
+        default=1,
+        help="How many cases to run against the model concurrently; keep it at "
+        "or below the number of model slots to avoid CPU/GPU contention",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=("thread", "process"),
+        default="thread",
+        help="Worker pool used when --max-workers is above 1",
+    )
     parser.add_argument(
         "--rag-canon-dir",
         default="rag/canon",
@@ -722,7 +1348,8 @@ def main() -> None:
     parser.add_argument(
         "--command-template",
         default="",
-        help="Optional custom command template with {prompt}",
+        help="Optional custom command template with {prompt}; split like a "
+        "shell command line but run without a shell",
     )
     parser.add_argument(
         "--prompt-file",
@@ -740,6 +1367,18 @@ def main() -> None:
 
     parser.add_argument("--llama-bin", default=default_llama_bin)
     parser.add_argument("--model-file", default=default_model_file)
+    parser.add_argument(
+        "--server-url",
+        default=os.getenv("MIND_LLAMA_SERVER_URL", ""),
+        help="llama-server base URL; when set, cases are sent to it over HTTP",
+    )
+    parser.add_argument(
+        "--llama-server-bin",
+        default=os.getenv("MIND_LLAMA_SERVER_BIN", ""),
+        help="Start this llama-server with --model-file for the run "
+        "(ignored when --server-url is set)",
+    )
+    parser.add_argument("--server-port", type=int, default=8080)
 
     args = parser.parse_args()
 
@@ -749,144 +1388,65 @@ def main() -> None:
     diagnosis_path = Path(args.diagnosis)
     rag_canon_dir = Path(args.rag_canon_dir)
 
-    inputs_data = json.loads(inputs_path.read_text())
-    schema_data = json.loads(schema_path.read_text())
+    inputs_data = _load_json(inputs_path)
+    schema_data = _load_json(schema_path)
+    required_top = tuple(schema_data.get("required", []))
+    required_set = frozenset(required_top)
 
     # Load prompt template
     prompt_template = _load_prompt_template(args.prompt_file)
 
-    canon_chunks: list[tuple[str, str]] = []
+    canon_index = CanonIndex()
     if not args.no_rag:
-        canon_chunks = _load_canon_chunks(rag_canon_dir)
+        canon_index = CanonIndex.build(_load_canon_chunks(rag_canon_dir))
 
     cases = inputs_data.get("cases", [])
     if args.max_cases and args.max_cases > 0:
         cases = cases[: args.max_cases]
-
-    results: list[CaseResult] = []
-
-    for case in cases:
-        case_id = str(case.get("id", "unknown"))
-        notes: list[str] = []
-
-        rag_context = _retrieve_canon_context(
-            case,
-            canon_chunks,
-            top_k=int(args.rag_top_k),
-            max_chars=int(args.rag_max_chars),
-            min_overlap=int(args.rag_min_overlap),
+    cases = [_prepare_case(case) for case in cases]
+
+    # Either a server the caller already runs, or one started for this run.
+    server: Any = contextlib.nullcontext(args.server_url)
+    if args.llama_server_bin and not args.server_url:
+        server = _LlamaServer(
+            args.llama_server_bin,
+            args.model_file,
+            args.server_port,
+            args.timeout,
+            parallel=args.max_workers,
         )
-        prompt = _prompt_for_case(
-            case, schema_data, rag_context=rag_context, prompt_template=prompt_template
+
+    with server as server_url:
+        args.server_url = server_url
+        # A partial rather than a closure so process workers can unpickle it.
+        evaluate = functools.partial(
+            _evaluate_case,
+            args=args,
+            schema_data=schema_data,
+            canon_index=canon_index,
+            prompt_template=prompt_template,
+            required_top=required_top,
+            required_set=required_set,
         )
-        raw_output, invoke_notes = _run_phi(prompt, args)
-        notes.extend(invoke_notes)
-
-        payload = _extract_json_blob(raw_output)
-        json_valid = payload is not None
-
-        schema_valid = False
-        null_ok = False
-        canon_ok = False
-        hallucinated = 0
-        forbidden_hits = 0
-        has_conflict = False
-
-        if (
-            not json_valid
-            and raw_output
-            and not any(note.startswith("invocation_timeout:") for note in notes)
-        ):
-            repaired_payload, repair_notes = _repair_json_output(
-                raw_output,
-                schema_data,
-                args,
-            )
-            notes.extend(repair_notes)
-            if repaired_payload is not None:
-                payload = repaired_payload
-                json_valid = True
-
-        if json_valid and payload is not None:
-            canon_characters = [
-                value.strip()
-                for value in case.get("canon_characters", [])
-                if isinstance(value, str) and value.strip()
-            ]
-            allow_invention = bool(case.get("allow_invention", False))
-            if canon_characters and not allow_invention:
-                canon_lookup = {name.lower() for name in canon_characters}
-                entities = payload.get("entities")
-                if isinstance(entities, list):
-                    filtered_entities = []
-                    for entity in entities:
-                        if (
-                            isinstance(entity, str)
-                            and entity.strip().lower() in canon_lookup
-                        ):
-                            filtered_entities.append(entity)
-                    if filtered_entities != entities:
-                        payload["entities"] = filtered_entities
-                        notes.append("entities_clamped_to_canon")
-                    if not payload.get("entities"):
-                        payload["entities"] = [canon_characters[0]]
-                        notes.append("entities_defaulted_to_primary_canon")
-
-            schema_valid, schema_notes = _validate_required_fields(payload, schema_data)
-            notes.extend(schema_notes)
-
-            null_ok, null_notes = _check_null_policy(payload, schema_data)
-            notes.extend(null_notes)
-
-            canon_ok, hallucinated, forbidden_hits, canon_notes = _check_canon(
-                payload, case
+
+        # Cases are independent. Threads suit the usual run, where the time is
+        # spent waiting on the model; processes also spread the JSON and canon
+        # checks across cores. map() keeps results in case order.
+        if args.max_workers > 1:
+            executor_cls = (
+                ProcessPoolExecutor
+                if args.executor == "process"
+                else ThreadPoolExecutor
             )
-            notes.extend(canon_notes)
-
-            implied_conflict = _implied_conflict_from_input(case)
-            if implied_conflict:
-                beats = payload.get("beats")
-                if isinstance(beats, list) and beats:
-                    first_beat = beats[0]
-                    if isinstance(first_beat, dict):
-                        conflict_value = first_beat.get("conflict")
-                        if not (
-                            isinstance(conflict_value, str) and conflict_value.strip()
-                        ):
-                            first_beat["conflict"] = implied_conflict
-                            notes.append("conflict_autofilled")
-
-            has_conflict, conflict_notes = _check_conflict(payload)
-            notes.extend(conflict_notes)
+            with executor_cls(max_workers=args.max_workers) as executor:
+                results = list(executor.map(evaluate, cases))
         else:
-            notes.append("invalid_json")
-
-        results.append(
-            CaseResult(
-                case_id=case_id,
-                json_valid=json_valid,
-                schema_valid=schema_valid,
-                null_policy_ok=null_ok,
-                canon_consistent=canon_ok,
-                hallucinated_characters=hallucinated,
-                forbidden_fact_hits=forbidden_hits,
-                has_conflict=has_conflict,
-                notes=notes,
-                output_preview=raw_output[:500],
-            )
-        )
+            results = [evaluate(case) for case in cases]
 
     summary: dict[str, Any] = {
         "total_cases": len(results),
-        "json_valid_rate": _to_rate([item.json_valid for item in results]),
-        "schema_valid_rate": _to_rate([item.schema_valid for item in results]),
-        "null_policy_rate": _to_rate([item.null_policy_ok for item in results]),
-        "canon_consistency_rate": _to_rate([item.canon_consistent for item in results]),
-        "conflict_extraction_rate": _to_rate([item.has_conflict for item in results]),
-        "invocation_timeout_rate": _note_rate(results, "invocation_timeout:"),
-        "invocation_error_rate": _note_rate(results, "invocation_error:"),
-        "prompt_echo_rate": _note_rate(results, "prompt_echo"),
-        "repair_success_rate": _note_rate(results, "repaired_json_success"),
+        **_flag_rates(results),
+        **_note_rates(results),
         "total_hallucinated_characters": sum(
             item.hallucinated_characters for item in results
         ),
@@ -899,11 +1459,18 @@ def main() -> None:
         "inputs_file": str(inputs_path),
         "schema_file": str(schema_path),
         "summary": summary,
-        "cases": [item.to_dict() for item in results],
+        "cases": results,
     }
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(output_payload, indent=2))
+    if orjson is not None:
+        out_path.write_bytes(orjson.dumps(output_payload, option=orjson.OPT_INDENT_2))
+    else:
+        # iterencode writes straight into the file, chunk by chunk, instead of
+        # materializing the whole document as one string first.
+        with out_path.open("w") as fp:
+            for chunk in _RESULTS_ENCODER.iterencode(output_payload):
+                fp.write(chunk)
 
     diagnosis_text = _build_diagnosis(summary)
     diagnosis_path.write_text(diagnosis_text)
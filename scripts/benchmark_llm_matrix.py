@@ -16,11 +16,13 @@ Usage examples:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import re
 import shlex
 import subprocess
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
@@ -28,6 +30,35 @@ from typing import Any, cast
 from mind.cognition import get_llm_provider
 from mind.latent.contracts import build_latent_payload, validate_latent_payload
 
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+
+_JSON_DECODER = json.JSONDecoder()
+# Bound on "{" positions tried when salvaging JSON from surrounding prose
+_MAX_JSON_STARTS = 16
+# A JSON string (possibly cut off) or a brace, for matching an object's braces
+_JSON_BRACE_RE = re.compile(r'"(?:[^"\\]|\\.)*"?|[{}]', re.DOTALL)
+
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+# Opening string delimiter -> its closing one, for local JSON repair
+_STRING_CLOSERS = {'"': '"', "'": "'", "\u201c": "\u201d"}
+
+JSON_OUTPUT_REQUIREMENTS = (
+    "\n\nOutput requirements: return valid JSON only. No markdown. No explanations."
+)
+
+# Identical for every repair call, so servers that cache prompt prefixes
+# (llama-server, Ollama) only prefill the broken output that follows it.
+REPAIR_PROMPT_HEADER = (
+    "Repair the following output into valid JSON for the latent schema. "
+    "Return JSON only with keys: schema_version, domain, intent, entities, "
+    "constraints, structure, style, confidence, source.\n\n"
+    "Original output:\n"
+)
+
 
 @dataclass
 class ModelSpec:
@@ -49,9 +80,21 @@ def parse_model_spec(raw: str) -> ModelSpec:
 
 
 def load_json(path: Path) -> dict[str, Any]:
+    """Load a JSON file, reusing the parsed data until the file changes.
+
+    The returned dict is shared between calls and must not be mutated.
+    """
     if not path.exists():
         raise BenchmarkError(f"File not found: {path}")
-    return json.loads(path.read_text())
+    return _load_json_cached(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_json_cached(path: str, mtime_ns: int) -> dict[str, Any]:
+    # mtime_ns is only part of the cache key, so an edited file is re-read
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    return json.loads(Path(path).read_text())
 
 
 def keyword_coverage(output: str, keywords: list[str]) -> float:
@@ -87,14 +130,28 @@ def shape_prompt(case: dict[str, Any]) -> str:
     prompt = str(case.get("prompt", "")).strip()
 
     if case.get("expects_json", False):
-        prompt += (
-            "\n\nOutput requirements: return valid JSON only. "
-            "No markdown. No explanations."
-        )
+        prompt += JSON_OUTPUT_REQUIREMENTS
 
     return prompt
 
 
+def _object_end(text: str, start: int) -> int:
+    """Return the index just past the brace closing the one at ``start``.
+
+    Braces inside strings are skipped; returns -1 if the object never closes.
+    """
+    depth = 0
+    for match in _JSON_BRACE_RE.finditer(text, start):
+        token = match.group()
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return -1
+
+
 def try_parse_json(text: str) -> dict[str, Any] | None:
     """Try strict and salvaged JSON parsing from model output."""
     try:
@@ -104,19 +161,73 @@ def try_parse_json(text: str) -> dict[str, Any] | None:
     except json.JSONDecodeError:
         pass
 
-    match = re.search(r"\{.*\}", text, re.DOTALL)
-    if not match:
+    # Decode an object starting at a "{". raw_decode stops at the object's
+    # own closing brace, so trailing prose is ignored and there is no greedy
+    # regex to backtrack across long outputs. After a failure the search
+    # resumes past that object, never inside it.
+    start = text.find("{")
+    for _ in range(_MAX_JSON_STARTS):
+        if start == -1:
+            break
+        try:
+            parsed, _end = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError as exc:
+            end = -1 if exc.pos >= len(text) else _object_end(text, start)
+            if end == -1:
+                # Truncated output; an object nested in it is not the answer
+                return None
+            start = text.find("{", end)
+            continue
+        return cast(dict[str, Any], parsed)
+
+    return None
+
+
+def local_json_repair(text: str) -> dict[str, Any] | None:
+    """Parse near-JSON output after fixing the slips models make most often.
+
+    Handles markdown code fences, single- or smart-quoted strings and trailing
+    commas before a closing bracket, in one pass from the first "{".
+    """
+    fenced = _CODE_FENCE_RE.search(text)
+    if fenced:
+        text = fenced.group(1)
+    start = text.find("{")
+    if start == -1:
         return None
 
-    candidate = match.group(0).strip()
-    try:
-        parsed = json.loads(candidate)
-        if isinstance(parsed, dict):
-            return cast(dict[str, Any], parsed)
-    except json.JSONDecodeError:
-        pass
+    chars: list[str] = []
+    closer = ""
+    escaped = False
+    for char in text[start:]:
+        if closer:
+            if escaped:
+                escaped = False
+                if char == "'":
+                    # \' is not a JSON escape; the quote needs none
+                    chars[-1] = char
+                    continue
+            elif char == "\\":
+                escaped = True
+            elif char == closer:
+                char = '"'
+                closer = ""
+            elif char == '"':
+                char = '\\"'
+            chars.append(char)
+        elif char in _STRING_CLOSERS:
+            closer = _STRING_CLOSERS[char]
+            chars.append('"')
+        else:
+            if char in "}]":
+                end = len(chars) - 1
+                while end >= 0 and chars[end].isspace():
+                    end -= 1
+                if end >= 0 and chars[end] == ",":
+                    del chars[end]
+            chars.append(char)
 
-    return None
+    return try_parse_json("".join(chars))
 
 
 def build_encoder_fallback(case: dict[str, Any], output: str) -> dict[str, Any]:
@@ -126,6 +237,13 @@ def build_encoder_fallback(case: dict[str, Any], output: str) -> dict[str, Any]:
     return build_latent_payload(raw_input=raw_input, domain=domain)
 
 
+# One handle at a time: models are swept one after another (or each in its own
+# process), so the previous model's provider is dropped when the next loads.
+@functools.lru_cache(maxsize=1)
+def cached_provider(provider: str, model: str) -> Any:
+    return get_llm_provider(provider=provider, model=model)
+
+
 def generate_output(
     spec: ModelSpec,
     prompt: str,
@@ -138,7 +256,7 @@ def generate_output(
             raise BenchmarkError("custom provider requires --custom-command-template")
         return run_custom_command(custom_command_template, spec.model, prompt)
 
-    provider: Any = get_llm_provider(provider=spec.provider, model=spec.model)
+    provider = cached_provider(spec.provider, spec.model)
     return provider.generate(prompt, n_predict=n_predict, timeout=provider_timeout)
 
 
@@ -148,7 +266,13 @@ def evaluate_case(
     custom_command_template: str | None,
     n_predict: int,
     provider_timeout: int,
+    llm_repair: bool = True,
 ) -> dict[str, Any]:
+    # A case may ask for fewer tokens than the run-wide ceiling, never more
+    case_budget = case.get("max_tokens")
+    if case_budget:
+        n_predict = min(n_predict, int(case_budget))
+
     start = time.perf_counter()
     prompt = shape_prompt(case)
     output = generate_output(
@@ -173,14 +297,19 @@ def evaluate_case(
             schema_notes = [] if json_valid else errors
         else:
             schema_notes = ["Output is not valid JSON"]
+            # Cheap local fixes first; the model repair costs a full generation
+            parsed = local_json_repair(output)
+            if parsed is not None:
+                json_valid, errors = validate_latent_payload(parsed)
+                if json_valid:
+                    output = json.dumps(parsed)
+                    schema_adherence = 1.0
+                    schema_notes = ["local_repair_success"]
+                else:
+                    schema_notes = ["local_repair_failed"] + errors
 
-        if not json_valid:
-            repair_prompt = (
-                "Repair the following output into valid JSON for the latent schema. "
-                "Return JSON only with keys: schema_version, domain, intent, entities, "
-                "constraints, structure, style, confidence, source.\n\n"
-                f"Original output:\n{output}"
-            )
+        if not json_valid and llm_repair:
+            repair_prompt = REPAIR_PROMPT_HEADER + output
             try:
                 repaired = generate_output(
                     spec,
@@ -239,7 +368,75 @@ def evaluate_case(
     }
 
 
-def weighted_score(metrics: dict[str, Any], weights: dict[str, float]) -> float:
+def failed_case_result(case: dict[str, Any], exc: Exception) -> dict[str, Any]:
+    """Zero-score row for a case whose evaluation raised."""
+    return {
+        "case_id": case.get("id", "unknown"),
+        "task_type": case.get("task_type"),
+        "latency_seconds": 0,
+        "keyword_coverage": 0,
+        "expects_json": bool(case.get("expects_json", False)),
+        "json_valid": False,
+        "schema_notes": [f"execution_error: {exc}"],
+        "metrics": {
+            "schema_adherence": 0.0,
+            "instruction_following": 0.0,
+            "character_consistency": None,
+            "script_quality": None,
+            "latency": 0.0,
+            "cost": None,
+        },
+        "output_preview": "",
+        "auto_weighted_score": 0.0,
+        "auto_weighted_score_normalized": 0.0,
+    }
+
+
+def run_model_cases(
+    spec: ModelSpec,
+    cases: list[dict[str, Any]],
+    args: argparse.Namespace,
+) -> list[dict[str, Any]]:
+    """Evaluate every case against one model, in case order.
+
+    Up to ``args.max_workers`` cases are in flight at once, so a server with
+    continuous batching (llama-server, Ollama) decodes them together instead
+    of one request after another.
+    """
+
+    def run_case(case: dict[str, Any]) -> dict[str, Any]:
+        try:
+            return evaluate_case(
+                spec,
+                case,
+                args.custom_command_template,
+                args.n_predict,
+                args.provider_timeout,
+                args.llm_repair,
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            return failed_case_result(case, exc)
+
+    if args.max_workers <= 1:
+        return [run_case(case) for case in cases]
+    with ThreadPoolExecutor(max_workers=args.max_workers) as executor:
+        return list(executor.map(run_case, cases))
+
+
+def score_model(
+    spec: ModelSpec,
+    cases: list[dict[str, Any]],
+    args: argparse.Namespace,
+    weights: dict[str, float],
+) -> dict[str, Any]:
+    return aggregate_model_score(run_model_cases(spec, cases, args), weights)
+
+
+def weighted_totals(
+    metrics: dict[str, Any],
+    weights: dict[str, float],
+) -> tuple[float, float]:
+    """Weighted sum of the scored metrics and the total weight they carry."""
     total = 0.0
     active_weight = 0.0
     for key, weight in weights.items():
@@ -248,7 +445,11 @@ def weighted_score(metrics: dict[str, Any], weights: dict[str, float]) -> float:
             continue
         total += float(value) * weight
         active_weight += weight
+    return total, active_weight
 
+
+def weighted_score(metrics: dict[str, Any], weights: dict[str, float]) -> float:
+    total, active_weight = weighted_totals(metrics, weights)
     if active_weight == 0:
         return 0.0
     return total
@@ -258,15 +459,7 @@ def normalized_weighted_score(
     metrics: dict[str, Any],
     weights: dict[str, float],
 ) -> float:
-    raw_total = 0.0
-    active_weight = 0.0
-    for key, weight in weights.items():
-        value = metrics.get(key)
-        if value is None:
-            continue
-        raw_total += float(value) * weight
-        active_weight += weight
-
+    raw_total, active_weight = weighted_totals(metrics, weights)
     if active_weight == 0:
         return 0.0
     return raw_total / active_weight
@@ -277,26 +470,30 @@ def aggregate_model_score(
     weights: dict[str, float],
 ) -> dict[str, Any]:
     scored_cases: list[dict[str, Any]] = []
+    auto_scores: list[float] = []
+    normalized_scores: list[float] = []
     for result in case_results:
-        auto_score = weighted_score(result["metrics"], weights)
-        normalized_score = normalized_weighted_score(result["metrics"], weights)
+        # Both scores come from one pass over the metrics
+        total, active_weight = weighted_totals(result["metrics"], weights)
+        auto_score = normalized_score = 0.0
+        if active_weight != 0:
+            auto_score = round(total, 4)
+            normalized_score = round(total / active_weight, 4)
+        auto_scores.append(auto_score)
+        normalized_scores.append(normalized_score)
         scored_cases.append(
             {
                 **result,
-                "auto_weighted_score": round(auto_score, 4),
-                "auto_weighted_score_normalized": round(normalized_score, 4),
+                "auto_weighted_score": auto_score,
+                "auto_weighted_score_normalized": normalized_score,
             }
         )
 
     avg_score = 0.0
     avg_normalized_score = 0.0
     if scored_cases:
-        total = sum(cast(float, item["auto_weighted_score"]) for item in scored_cases)
-        total_normalized = sum(
-            cast(float, item["auto_weighted_score_normalized"]) for item in scored_cases
-        )
-        avg_score = total / len(scored_cases)
-        avg_normalized_score = total_normalized / len(scored_cases)
+        avg_score = sum(auto_scores) / len(scored_cases)
+        avg_normalized_score = sum(normalized_scores) / len(scored_cases)
     return {
         "cases": scored_cases,
         "auto_average_score": round(avg_score, 4),
@@ -339,7 +536,10 @@ def build_parser() -> argparse.ArgumentParser:
         "--n-predict",
         type=int,
         default=240,
-        help="Tokens to request per case (lower values are faster on local models).",
+        help=(
+            "Tokens to request per case (lower values are faster on local models). "
+            "A case's own max_tokens can lower it further."
+        ),
     )
     parser.add_argument(
         "--provider-timeout",
@@ -347,6 +547,32 @@ def build_parser() -> argparse.ArgumentParser:
         default=300,
         help="Per-case timeout in seconds for provider.generate calls.",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=1,
+        help=(
+            "Cases to run concurrently per model. Raise it for providers served "
+            "with continuous batching; latency scores then include queueing."
+        ),
+    )
+    parser.add_argument(
+        "--llm-repair",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help=(
+            "Ask the model to repair JSON that local fixes cannot recover "
+            "(one extra generation per broken case)."
+        ),
+    )
+    parser.add_argument(
+        "--parallel-models",
+        action="store_true",
+        help=(
+            "Benchmark all models at once, one process each. Only useful when "
+            "they do not share a CPU/GPU, e.g. remote APIs or separate devices."
+        ),
+    )
     return parser
 
 
@@ -368,43 +594,15 @@ def main() -> None:
         "results": {},
     }
 
-    for raw_model in args.models:
-        spec = parse_model_spec(raw_model)
-        case_results: list[dict[str, Any]] = []
-
-        for case in cases:
-            try:
-                result = evaluate_case(
-                    spec,
-                    case,
-                    args.custom_command_template,
-                    args.n_predict,
-                    args.provider_timeout,
-                )
-            except Exception as exc:  # pylint: disable=broad-except
-                result = {
-                    "case_id": case.get("id", "unknown"),
-                    "task_type": case.get("task_type"),
-                    "latency_seconds": 0,
-                    "keyword_coverage": 0,
-                    "expects_json": bool(case.get("expects_json", False)),
-                    "json_valid": False,
-                    "schema_notes": [f"execution_error: {exc}"],
-                    "metrics": {
-                        "schema_adherence": 0.0,
-                        "instruction_following": 0.0,
-                        "character_consistency": None,
-                        "script_quality": None,
-                        "latency": 0.0,
-                        "cost": None,
-                    },
-                    "output_preview": "",
-                    "auto_weighted_score": 0.0,
-                    "auto_weighted_score_normalized": 0.0,
-                }
-            case_results.append(result)
-
-        matrix["results"][raw_model] = aggregate_model_score(case_results, weights)
+    specs = [parse_model_spec(raw_model) for raw_model in args.models]
+    run = functools.partial(score_model, cases=cases, args=args, weights=weights)
+    if args.parallel_models and len(specs) > 1:
+        with ProcessPoolExecutor(max_workers=len(specs)) as executor:
+            model_scores = list(executor.map(run, specs))
+    else:
+        model_scores = [run(spec) for spec in specs]
+    for raw_model, details in zip(args.models, model_scores):
+        matrix["results"][raw_model] = details
 
     ranking = sorted(
         (
@@ -425,7 +623,12 @@ def main() -> None:
 
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(matrix, indent=2))
+    if orjson is not None:
+        out_path.write_bytes(orjson.dumps(matrix, option=orjson.OPT_INDENT_2))
+    else:
+        # Streamed, so the whole indented document never sits in memory at once
+        with out_path.open("w", encoding="utf-8") as out_file:
+            json.dump(matrix, out_file, indent=2)
 
     print(f"Saved benchmark results to {out_path}")
     print("Ranking:")
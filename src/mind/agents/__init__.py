@@ -4,7 +4,10 @@
 # This module now only contains Mind's meta-system agents
 
 from .base_agent import BaseAgent
+from .types import EchoResponse, Evaluation
 
 __all__ = [
     "BaseAgent",
+    "EchoResponse",
+    "Evaluation",
 ]
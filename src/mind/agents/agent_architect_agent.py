@@ -4,6 +4,8 @@ from .base_agent import BaseAgent
 class AgentArchitectAgent(BaseAgent):
     """Designs the internal agents of the subsystem."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="agent_architect_agent",
@@ -11,6 +13,5 @@ class AgentArchitectAgent(BaseAgent):
         )
 
     def run(self, architecture: dict) -> dict:
-        architecture["agents"] = []
         self.log("Created initial agent list.")
-        return architecture
+        return {"agents": []}
@@ -1,23 +1,37 @@
-from typing import List, Any
+import logging
+from collections import deque
+from typing import Any, Deque
 from ..utils.logger import get_logger
 
+# Maximum number of entries kept in an agent's history.
+HISTORY_LIMIT = 1024
+
 
 class BaseAgent:
     """
     Base class for all Mind meta-agents.
     Provides a consistent interface and shared utilities.
+
+    Subclasses should declare ``__slots__`` for any attributes they add.
     """
 
+    __slots__ = ("name", "description", "history", "logger")
+
     def __init__(self, name: str, description: str):
         self.name: str = name
         self.description: str = description
-        self.history: List[str] = []
+        self.history: Deque[str] = deque(maxlen=HISTORY_LIMIT)
         self.logger = get_logger(self.name)
 
-    def log(self, entry: str) -> None:
-        """Append an entry to the agent's history and log it."""
-        self.history.append(entry)
-        self.logger.info(entry)
+    def log(self, fmt: str, *args: Any) -> None:
+        """Append an entry to the agent's history and log it.
+
+        `fmt % args` is only formatted when INFO is enabled for the logger.
+        """
+        if self.logger.isEnabledFor(logging.INFO):
+            entry = fmt % args if args else fmt
+            self.history.append(entry)
+            self.logger.info(entry)
 
     def run(self, *args: Any, **kwargs: Any) -> Any:
         """Main execution method. Must be implemented by subclasses."""
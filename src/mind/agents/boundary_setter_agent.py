@@ -4,6 +4,8 @@ from .base_agent import BaseAgent
 class BoundarySetterAgent(BaseAgent):
     """Defines what the system should and should not do."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="boundary_setter_agent",
@@ -11,6 +13,5 @@ class BoundarySetterAgent(BaseAgent):
         )
 
     def run(self, architecture: dict, constraints: list) -> dict:
-        architecture["boundaries"] = constraints
-        self.log(f"Applied boundaries: {constraints}")
-        return architecture
+        self.log("Applied boundaries: %s", constraints)
+        return {"boundaries": constraints}
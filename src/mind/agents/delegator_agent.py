@@ -4,6 +4,8 @@ from .base_agent import BaseAgent
 class DelegatorAgent(BaseAgent):
     """Hands off subsystems to run autonomously."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="delegator_agent",
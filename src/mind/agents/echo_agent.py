@@ -1,11 +1,16 @@
 from .base_agent import BaseAgent
+from .types import EchoResponse
 
 
 class EchoAgent(BaseAgent):
     """A simple agent that returns whatever it receives."""
 
-    def act(self, context: dict):
-        return {
-            "agent": self.name,
-            "received": context,
-        }
+    __slots__ = ()
+
+    def __init__(
+        self, name: str = "echo", description: str = "Returns whatever it receives."
+    ):
+        super().__init__(name=name, description=description)
+
+    def act(self, context: dict) -> EchoResponse:
+        return EchoResponse(self.name, context)
@@ -1,39 +1,38 @@
 from .base_agent import BaseAgent
+from .types import Evaluation
+
+_MIN_COMPONENTS = 5
+
+_COMPLEXITY_SCORES = {"medium": 2}
+_COMPLEXITY_ISSUES = {"high": ("System may be too complex to maintain.",)}
+# Any complexity other than these falls back to _UNCLEAR_COMPLEXITY.
+_COMPLEXITY_SUGGESTIONS = {"medium": (), "high": ()}
+_UNCLEAR_COMPLEXITY = ("Clarify complexity level.",)
+_FEW_COMPONENTS = ("Add more explicit components for clarity.",)
 
 
 class EvaluatorAgent(BaseAgent):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="evaluator_agent",
             description="Evaluates system quality and suggests improvements.",
         )
 
-    def run(self, system_output: dict) -> dict:
+    def run(self, system_output: dict) -> Evaluation:
         components = system_output.get("components", [])
         complexity = system_output.get("complexity", "unknown")
 
-        score = 0
-        issues = []
-        suggestions = []
-
-        if len(components) >= 5:
-            score += 3
-        else:
-            score += 1
-            suggestions.append("Add more explicit components for clarity.")
-
-        if complexity == "medium":
-            score += 2
-        elif complexity == "high":
-            issues.append("System may be too complex to maintain.")
-        else:
-            suggestions.append("Clarify complexity level.")
-
-        evaluation = {
-            "score": score,
-            "issues": issues,
-            "suggestions": suggestions,
-        }
-
-        self.log(f"Evaluation: {evaluation}")
+        enough_components = len(components) >= _MIN_COMPONENTS
+        score = (3 if enough_components else 1) + _COMPLEXITY_SCORES.get(complexity, 0)
+        issues = list(_COMPLEXITY_ISSUES.get(complexity, ()))
+        suggestions = [
+            *(() if enough_components else _FEW_COMPONENTS),
+            *_COMPLEXITY_SUGGESTIONS.get(complexity, _UNCLEAR_COMPLEXITY),
+        ]
+
+        evaluation = Evaluation(score=score, issues=issues, suggestions=suggestions)
+
+        self.log("Evaluation: %s", evaluation)
         return evaluation
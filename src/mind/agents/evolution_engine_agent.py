@@ -1,21 +1,24 @@
 from .base_agent import BaseAgent
+from .types import Evaluation
 
 
 class EvolutionEngineAgent(BaseAgent):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="evolution_engine_agent", description="Improves systems over time."
         )
 
-    def run(self, evaluation: dict) -> dict:
+    def run(self, evaluation: Evaluation) -> dict:
         improvements = []
         next_steps = []
 
-        if evaluation.get("score", 0) < 4:
+        if evaluation.score < 4:
             improvements.append("Refine component boundaries.")
             next_steps.append("Add more detailed components to architecture.")
 
-        if evaluation.get("issues"):
+        if evaluation.issues:
             next_steps.append("Address listed issues before implementation.")
 
         if not improvements and not next_steps:
@@ -27,5 +30,5 @@ class EvolutionEngineAgent(BaseAgent):
             "next_steps": next_steps,
         }
 
-        self.log(f"Evolution plan: {evolution_plan}")
+        self.log("Evolution plan: %s", evolution_plan)
         return evolution_plan
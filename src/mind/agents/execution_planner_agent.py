@@ -4,6 +4,8 @@ from .base_agent import BaseAgent
 class ExecutionPlannerAgent(BaseAgent):
     """Breaks the system into phases and tasks."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="execution_planner_agent",
@@ -11,9 +13,10 @@ class ExecutionPlannerAgent(BaseAgent):
         )
 
     def run(self, architecture: dict) -> dict:
-        architecture["execution_plan"] = {
-            "phases": [],
-            "tasks": [],
-        }
         self.log("Created execution plan.")
-        return architecture
+        return {
+            "execution_plan": {
+                "phases": [],
+                "tasks": [],
+            }
+        }
@@ -1,48 +1,122 @@
-import spacy
+import os
+from bisect import bisect_right
+from collections import OrderedDict
+
 from .base_agent import BaseAgent
+from ..utils.logger import get_logger
+
+# Naive constraints: sentences containing words like "privacy", "local", "time"
+_CONSTRAINT_KEYWORDS = ("privacy", "local", "time", "energy", "budget")
+
+# Number of analyzed goals kept per agent for repeated inputs
+DOC_CACHE_SIZE = 128
+
+# Shared across every GoalInterpreterAgent instance; loaded on first use.
+_NLP = None
+# spacy.tokens.DocBin and spacy.symbols.VERB, resolved alongside _NLP
+_DocBin = None
+_VERB = None
+
+
+def _blank_nlp():
+    """Basic tokenizer with sentence boundaries, no trained components."""
+    import spacy
+
+    nlp = spacy.blank("en")
+    if "sentencizer" not in nlp.pipe_names:
+        nlp.add_pipe("sentencizer")
+    return nlp
+
+
+def _get_nlp():
+    """Return the process-wide spaCy pipeline, loading it once."""
+    global _NLP, _DocBin, _VERB
+    if _NLP is None:
+        # spaCy is imported here so importing the agents stays cheap
+        import spacy
+        from spacy.symbols import VERB
+        from spacy.tokens import DocBin
+
+        _DocBin, _VERB = DocBin, VERB
+
+        # Skip loading heavy models in test environment for speed
+        if os.getenv("SKIP_EMBEDDER", "0") == "1":
+            _NLP = _blank_nlp()
+            return _NLP
+        try:
+            # Only POS tags and lemmas are used; sentences come from the
+            # lightweight sentencizer instead of the dependency parser.
+            _NLP = spacy.load("en_core_web_sm", disable=["ner", "parser"])
+            _NLP.add_pipe("sentencizer")
+        except OSError:
+            get_logger("goal_interpreter_agent").warning(
+                "Spacy model 'en_core_web_sm' not found. "
+                "Install it with: python -m spacy download en_core_web_sm"
+            )
+            # Fall back to a basic tokenizer with sentencizer
+            _NLP = _blank_nlp()
+    return _NLP
+
+
+def _constraint_sentences(raw_input: str, sents: list) -> list:
+    """Return the stripped text of sentences containing a constraint keyword."""
+    lowered = raw_input.lower()
+    if len(lowered) != len(raw_input):
+        # Lowercasing changed the length, so offsets no longer line up
+        return [
+            sent.text.strip()
+            for sent in sents
+            if any(k in sent.text.lower() for k in _CONSTRAINT_KEYWORDS)
+        ]
+
+    # Find every keyword once over the whole text, then attribute each hit
+    # to the sentence it falls in.
+    starts = [sent.start_char for sent in sents]
+    hits = set()
+    for keyword in _CONSTRAINT_KEYWORDS:
+        pos = lowered.find(keyword)
+        while pos != -1:
+            index = bisect_right(starts, pos) - 1
+            if index >= 0 and pos + len(keyword) <= sents[index].end_char:
+                hits.add(index)
+            pos = lowered.find(keyword, pos + 1)
+    return [sents[index].text.strip() for index in sorted(hits)]
 
 
 class GoalInterpreterAgent(BaseAgent):
+    __slots__ = ("_nlp_factory", "_doc_cache")
+
     def __init__(self):
         super().__init__(
             name="goal_interpreter_agent",
             description="Understands Cristian's intentions and converts them into structured goals.",
         )
-        self.nlp = None  # Lazy load on first use
-
-    def _ensure_nlp_loaded(self):
-        """Lazy load the spacy model on first use."""
-        if self.nlp is None:
-            try:
-                self.nlp = spacy.load("en_core_web_sm")
-            except OSError:
-                self.logger.warning(
-                    "Spacy model 'en_core_web_sm' not found. "
-                    "Install it with: python -m spacy download en_core_web_sm"
-                )
-                # Fall back to a basic tokenizer with sentencizer
-                self.nlp = spacy.blank("en")
-                if "sentencizer" not in self.nlp.pipe_names:
-                    self.nlp.add_pipe("sentencizer")
+        self._nlp_factory = _get_nlp  # Lazy load on first use
+        self._doc_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def _analyze(self, raw_input: str):
+        """Run the pipeline, reusing the serialized Doc for repeated inputs."""
+        nlp = self._nlp_factory()
+        cached = self._doc_cache.get(raw_input)
+        if cached is not None:
+            self._doc_cache.move_to_end(raw_input)
+            return next(_DocBin().from_bytes(cached).get_docs(nlp.vocab))
+
+        doc = nlp(raw_input)
+        doc_bin = _DocBin(store_user_data=True)
+        doc_bin.add(doc)
+        self._doc_cache[raw_input] = doc_bin.to_bytes()
+        if len(self._doc_cache) > DOC_CACHE_SIZE:
+            self._doc_cache.popitem(last=False)
+        return doc
 
     def run(self, raw_input: str) -> dict:
-        self._ensure_nlp_loaded()
-        doc = self.nlp(raw_input)
+        doc = self._analyze(raw_input)
 
         # Naive intent: first verb lemma
-        intent = None
-        for token in doc:
-            if token.pos_ == "VERB":
-                intent = token.lemma_
-                break
-
-        # Naive constraints: sentences containing words like "privacy", "local", "time"
-        constraint_keywords = ["privacy", "local", "time", "energy", "budget"]
-        constraints = [
-            sent.text.strip()
-            for sent in doc.sents
-            if any(k in sent.text.lower() for k in constraint_keywords)
-        ]
+        intent = next((token.lemma_ for token in doc if token.pos == _VERB), None)
+
+        constraints = _constraint_sentences(raw_input, list(doc.sents))
 
         structured_goal = {
             "raw_text": raw_input,
@@ -52,5 +126,5 @@ class GoalInterpreterAgent(BaseAgent):
             "emotional_tone": doc.sentiment if hasattr(doc, "sentiment") else None,
         }
 
-        self.log(f"Interpreted goal: {structured_goal}")
+        self.log("Interpreted goal: %s", structured_goal)
         return structured_goal
@@ -46,7 +46,7 @@ class NewscastBroadcastPipeline:
 
         try:
             # Stage 1: Analysis with retry
-            logger.info(f"[{broadcast_id}] Stage 1: Analyzing topic '{topic}'")
+            logger.info("[%s] Stage 1: Analyzing topic '%s'", broadcast_id, topic)
             analysis = self._run_with_retry(
                 stage="analysis",
                 broadcast_id=broadcast_id,
@@ -59,7 +59,7 @@ class NewscastBroadcastPipeline:
                 return {"status": "failed", "error": "Analysis stage failed after retries"}
 
             # Stage 2: Script writing with retry
-            logger.info(f"[{broadcast_id}] Stage 2: Writing script")
+            logger.info("[%s] Stage 2: Writing script", broadcast_id)
             word_count = int((duration / 60) * 150)
             script = self._run_with_retry(
                 stage="scripting",
@@ -88,7 +88,7 @@ class NewscastBroadcastPipeline:
             with open(broadcast_file, "w") as f:
                 json.dump(broadcast, f, indent=2)
 
-            logger.info(f"[{broadcast_id}] Broadcast created successfully")
+            logger.info("[%s] Broadcast created successfully", broadcast_id)
             return {
                 "status": "success",
                 "broadcast_id": broadcast_id,
@@ -96,7 +96,7 @@ class NewscastBroadcastPipeline:
             }
 
         except Exception as e:
-            logger.error(f"[{broadcast_id}] Broadcast creation failed: {e}")
+            logger.error("[%s] Broadcast creation failed: %s", broadcast_id, e)
             return {"status": "failed", "error": str(e), "broadcast_id": broadcast_id}
 
     def list_broadcasts(self) -> List[Dict[str, Any]]:
@@ -162,14 +162,28 @@ class NewscastBroadcastPipeline:
             try:
                 result = fn()
                 if not result or not result.strip():
-                    logger.warning(f"[{broadcast_id}] {stage} attempt {attempt} returned empty result")
+                    logger.warning(
+                        "[%s] %s attempt %s returned empty result",
+                        broadcast_id,
+                        stage,
+                        attempt,
+                    )
                     continue
-                logger.info(f"[{broadcast_id}] {stage} succeeded on attempt {attempt}")
+                logger.info(
+                    "[%s] %s succeeded on attempt %s", broadcast_id, stage, attempt
+                )
                 return result
             except Exception as e:
-                logger.warning(f"[{broadcast_id}] {stage} attempt {attempt} failed: {e}")
+                logger.warning(
+                    "[%s] %s attempt %s failed: %s", broadcast_id, stage, attempt, e
+                )
                 if attempt == max_retries:
-                    logger.error(f"[{broadcast_id}] {stage} failed after {max_retries} attempts")
+                    logger.error(
+                        "[%s] %s failed after %s attempts",
+                        broadcast_id,
+                        stage,
+                        max_retries,
+                    )
                     return None
         return None
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
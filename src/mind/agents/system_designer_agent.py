@@ -1,7 +1,28 @@
 from .base_agent import BaseAgent
 
+# Shared by every proposed architecture; no downstream stage mutates them.
+_COMPONENTS = (
+    "input_handler",
+    "reasoning_core",
+    "agent_orchestrator",
+    "storage_layer",
+    "interface_layer",
+)
+
+_DATA_FLOW = (
+    "user_input -> input_handler",
+    "input_handler -> reasoning_core",
+    "reasoning_core -> agent_orchestrator",
+    "agent_orchestrator -> storage_layer",
+    "agent_orchestrator -> interface_layer",
+)
+
+_TRADEOFFS = ("modularity vs. complexity",)
+
 
 class SystemDesignerAgent(BaseAgent):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="system_designer_agent",
@@ -11,29 +32,13 @@ class SystemDesignerAgent(BaseAgent):
     def run(self, interpreted_goal: dict) -> dict:
         intent = interpreted_goal.get("intent") or "build_subsystem"
 
-        components = [
-            "input_handler",
-            "reasoning_core",
-            "agent_orchestrator",
-            "storage_layer",
-            "interface_layer",
-        ]
-
-        data_flow = [
-            "user_input -> input_handler",
-            "input_handler -> reasoning_core",
-            "reasoning_core -> agent_orchestrator",
-            "agent_orchestrator -> storage_layer",
-            "agent_orchestrator -> interface_layer",
-        ]
-
         architecture = {
             "name": f"{intent}_architecture",
-            "components": components,
-            "data_flow": data_flow,
-            "tradeoffs": ["modularity vs. complexity"],
+            "components": _COMPONENTS,
+            "data_flow": _DATA_FLOW,
+            "tradeoffs": _TRADEOFFS,
             "complexity": "medium",
         }
 
-        self.log(f"Proposed architecture: {architecture}")
+        self.log("Proposed architecture: %s", architecture)
         return architecture
@@ -4,6 +4,8 @@ from .base_agent import BaseAgent
 class ToolSelectorAgent(BaseAgent):
     """Chooses tools, libraries, APIs, and formats."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="tool_selector_agent",
@@ -11,11 +13,11 @@ class ToolSelectorAgent(BaseAgent):
         )
 
     def run(self, architecture: dict) -> dict:
-        architecture["tools"] = {
+        tools = {
             "language": "python",
             "frameworks": [],
             "apis": [],
             "storage": "json",
         }
-        self.log(f"Selected tools: {architecture['tools']}")
-        return architecture
+        self.log("Selected tools: %s", tools)
+        return {"tools": tools}
@@ -0,0 +1,21 @@
+"""Shared value types passed between meta-agents."""
+
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass(slots=True, frozen=True)
+class Evaluation:
+    """Result of evaluating a proposed system."""
+
+    score: int
+    issues: List[str] = field(default_factory=list)
+    suggestions: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True, frozen=True)
+class EchoResponse:
+    """What EchoAgent hands back for a context."""
+
+    agent: str
+    received: dict
@@ -294,6 +294,42 @@ def history():
         sys.exit(1)
 
 
+@mind_cli.command()
+@click.argument("blueprint")
+def submit(blueprint: str):
+    """Queue a blueprint run on the Celery workers
+
+    Examples:
+
+      mind submit blueprints/meta_system.yaml
+    """
+    from mind.core.tasks import submit_blueprint
+
+    try:
+        task_id = submit_blueprint(blueprint)
+        click.secho(f"✓ Queued: {task_id}", fg="green")
+    except Exception as e:
+        click.secho(f"✗ Error: {e}", fg="red", err=True)
+        sys.exit(1)
+
+
+@mind_cli.command()
+@click.argument("task_id")
+def task(task_id: str):
+    """Show the status of a queued blueprint run"""
+    from mind.core.tasks import get_task_state
+
+    try:
+        state = get_task_state(task_id)
+        if not state:
+            click.secho(f"Unknown task: {task_id}", fg="yellow")
+            return
+        click.echo(json.dumps(state, indent=2))
+    except Exception as e:
+        click.secho(f"✗ Error: {e}", fg="red", err=True)
+        sys.exit(1)
+
+
 @mind_cli.command()
 def version():
     """Show Mind version and system info"""
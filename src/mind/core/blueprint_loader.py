@@ -1,9 +1,85 @@
-import yaml
+import copy
+import functools
+import hashlib
+import json
+import os
 from pathlib import Path
+from typing import Optional
+
+# Directory for compiled JSON copies of blueprints; unset keeps them in memory
+CACHE_DIR_ENV = "MIND_BLUEPRINT_CACHE"
+
+
+def _parse_yaml(raw: bytes) -> dict:
+    """Parse YAML, importing PyYAML only when a blueprint actually needs it."""
+    import yaml
+
+    try:
+        loader = yaml.CSafeLoader  # libyaml C parser
+    except AttributeError:  # pragma: no cover - PyYAML built without libyaml
+        loader = yaml.SafeLoader
+    return yaml.load(raw, Loader=loader)
+
+
+def _write_compiled(json_path: Path, data: dict) -> None:
+    """Store `data` as JSON if it survives the round trip unchanged."""
+    try:
+        encoded = json.dumps(data)
+    except (TypeError, ValueError):
+        return  # YAML-only types (dates, sets, ...) stay uncompiled
+    if json.loads(encoded) != data:
+        return  # e.g. non-string mapping keys
+    try:
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = json_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(encoded, encoding="utf-8")
+        tmp_path.replace(json_path)
+    except OSError:
+        pass  # Cache is best-effort
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_blueprint(path: str, mtime_ns: int, cache_dir: Optional[str]) -> dict:
+    """Parse a blueprint file. Cached per (path, mtime) so edits are picked up.
+
+    With a cache directory, the YAML is compiled once to a JSON file named
+    after its sha256 and later processes decode that instead.
+    """
+    # One read of the whole file; PyYAML and json detect the encoding from
+    # the bytes themselves, so nothing depends on the locale.
+    raw = Path(path).read_bytes()
+    if cache_dir is None:
+        return _parse_yaml(raw)
+
+    json_path = Path(cache_dir) / f"{hashlib.sha256(raw).hexdigest()}.json"
+    try:
+        return json.loads(json_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+
+    data = _parse_yaml(raw)
+    _write_compiled(json_path, data)
+    return data
 
 
 class BlueprintLoader:
-    """Loads and validates blueprint files."""
+    """Loads and validates blueprint files.
+
+    Parses are cached per file and mtime; each load returns its own copy, so
+    callers may modify the result freely.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize loader.
+
+        Args:
+            cache_dir: Where compiled JSON copies of blueprints are kept.
+                Defaults to $MIND_BLUEPRINT_CACHE; with neither set, nothing
+                is written to disk.
+        """
+        if cache_dir is None:
+            cache_dir = os.getenv(CACHE_DIR_ENV) or None
+        self.cache_dir = None if cache_dir is None else str(cache_dir)
 
     def load(self, path: str) -> dict:
         file_path = Path(path)
@@ -17,5 +93,8 @@ class BlueprintLoader:
             else:
                 raise FileNotFoundError(f"Blueprint not found: {path}")
 
-        with open(file_path, "r") as f:
-            return yaml.safe_load(f)
+        resolved = file_path.resolve()
+        parsed = _parse_blueprint(
+            str(resolved), resolved.stat().st_mtime_ns, self.cache_dir
+        )
+        return copy.deepcopy(parsed)
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+
 from .blueprint_loader import BlueprintLoader
 from ..agents.goal_interpreter_agent import GoalInterpreterAgent
 from ..agents.system_designer_agent import SystemDesignerAgent
@@ -9,6 +12,32 @@ from ..agents.evaluator_agent import EvaluatorAgent
 from ..agents.evolution_engine_agent import EvolutionEngineAgent
 from ..agents.delegator_agent import DelegatorAgent
 
+# Stages that return only their own additions to the architecture and do
+# not read each other's output. Consecutive runs of them execute concurrently.
+PARALLEL_STAGES = frozenset(
+    {
+        "boundary_setter_agent",
+        "tool_selector_agent",
+        "agent_architect_agent",
+        "execution_planner_agent",
+    }
+)
+
+
+def _group_stages(pipeline: list) -> list:
+    """Split a pipeline into serial steps and batches of parallel stages."""
+    groups: list = []
+    for step in pipeline:
+        if (
+            step["agent"] in PARALLEL_STAGES
+            and groups
+            and groups[-1][0]["agent"] in PARALLEL_STAGES
+        ):
+            groups[-1].append(step)
+        else:
+            groups.append([step])
+    return groups
+
 
 class MetaOrchestrator:
     def __init__(self):
@@ -24,6 +53,58 @@ class MetaOrchestrator:
             "evolution_engine_agent": EvolutionEngineAgent(),
             "delegator_agent": DelegatorAgent(),
         }
+        # Compiled stage callables, keyed by the pipeline's agent sequence
+        self._plans: Dict[tuple, tuple] = {}
+
+    def _bind_step(self, name: str) -> Callable:
+        """Bind an agent to a uniform (context, goal_text, constraints) call."""
+        run = self.agents[name].run
+
+        if name == "goal_interpreter_agent":
+            return lambda context, goal_text, constraints: run(goal_text)
+        if name == "boundary_setter_agent":
+            return lambda context, goal_text, constraints: run(context, constraints)
+        return lambda context, goal_text, constraints: run(context)
+
+    def _compile_group(self, names: list) -> Callable:
+        """Build the callable for one serial step or batch of parallel stages."""
+        calls = [self._bind_step(name) for name in names]
+        if names[0] not in PARALLEL_STAGES:
+            return calls[0]
+
+        def run_group(context, goal_text: str, constraints: list):
+            if len(calls) > 1 and isinstance(context, dict):
+                return self._run_parallel(calls, context, goal_text, constraints)
+            for call in calls:
+                context = context | call(context, goal_text, constraints)
+            return context
+
+        return run_group
+
+    def _compile_pipeline(self, pipeline: list) -> tuple:
+        """Resolve a pipeline to its stage callables once per pipeline shape."""
+        key = tuple(step["agent"] for step in pipeline)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = tuple(
+                self._compile_group([step["agent"] for step in steps])
+                for steps in _group_stages(pipeline)
+            )
+            self._plans[key] = plan
+        return plan
+
+    def _run_parallel(
+        self, calls: list, context: dict, goal_text: str, constraints: list
+    ) -> dict:
+        """Run independent stages concurrently and merge their additions."""
+        with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+            futures = [
+                pool.submit(call, context, goal_text, constraints) for call in calls
+            ]
+            merged = dict(context)
+            for future in futures:
+                merged |= future.result()
+        return merged
 
     def run_blueprint(self, path: str) -> dict:
         blueprint = self.loader.load(path)
@@ -31,15 +112,8 @@ class MetaOrchestrator:
         constraints = blueprint.get("constraints", [])
         context = None
 
-        for step in blueprint["pipeline"]:
-            agent = self.agents[step["agent"]]
-
-            if step["agent"] == "goal_interpreter_agent":
-                context = agent.run(goal_text)
-            elif step["agent"] == "boundary_setter_agent":
-                context = agent.run(context, constraints)
-            else:
-                context = agent.run(context)
+        for stage in self._compile_pipeline(blueprint["pipeline"]):
+            context = stage(context, goal_text, constraints)
 
         return {
             "final_output": context,
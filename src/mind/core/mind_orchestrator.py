@@ -35,13 +35,13 @@ class MindOrchestrator:
     def think(self, input_data: dict) -> dict:
         """Mind interprets and transforms input."""
         thought = self.thinking.think(input_data)
-        self.logger.info(f"Thought: {thought}")
+        self.logger.info("Thought: %s", thought)
         return thought
 
     def act(self, blueprint_path: str) -> dict:
         """Mind executes a blueprint (meta or normal)."""
         result = self.meta.run_blueprint(blueprint_path)
-        self.logger.info(f"Action result: {result}")
+        self.logger.info("Action result: %s", result)
         return result
 
     def reflect(self, result: dict):
@@ -57,7 +57,7 @@ class MindOrchestrator:
             "total_architectures": len(self.memory["architectures"]),
         }
         self.memory["evolutions"].append(evolution)
-        self.logger.info(f"Evolution step: {evolution}")
+        self.logger.info("Evolution step: %s", evolution)
         return evolution
 
     # -------------------------
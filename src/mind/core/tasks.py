@@ -0,0 +1,122 @@
+"""Queue blueprint runs on Celery workers, with task state kept in Redis.
+
+Optional: requires ``pip install 'mind[queue]'`` (celery + redis).
+Start workers with ``celery -A mind.core.tasks worker``.
+"""
+
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict
+
+from ..utils.logger import get_logger
+
+try:
+    import redis
+    from celery import Celery
+except ImportError:  # Optional dependency
+    redis = None
+    Celery = None
+
+BROKER_URL = os.getenv("MIND_BROKER_URL", "redis://localhost:6379/0")
+STATE_URL = os.getenv("MIND_STATE_URL", BROKER_URL)
+# Seconds a finished task's state stays readable before Redis expires it
+TASK_STATE_TTL = int(os.getenv("MIND_TASK_STATE_TTL", str(7 * 24 * 3600)))
+
+logger = get_logger(__name__)
+
+
+def _require_queue() -> None:
+    if Celery is None:
+        raise RuntimeError(
+            "Queued blueprint runs need celery and redis. "
+            "Install them with: pip install 'mind[queue]'"
+        )
+
+
+def _state_store():
+    return redis.Redis.from_url(STATE_URL, decode_responses=True)
+
+
+def _state_key(task_id: str) -> str:
+    return f"task:{task_id}"
+
+
+def _finish(store, key: str, mapping: Dict[str, str]) -> None:
+    """Record a final state and let Redis drop it after TASK_STATE_TTL."""
+    store.hset(key, mapping=mapping)
+    store.expire(key, TASK_STATE_TTL)
+
+
+def _run_blueprint_task(task, task_id: str, path: str) -> str:
+    """Body of run_agent_blueprint; ``task`` is the bound Celery task."""
+    from .mind_orchestrator import MindOrchestrator
+
+    store = _state_store()
+    key = _state_key(task_id)
+    store.hset(key, mapping={"status": "running"})
+    start = time.perf_counter()
+
+    try:
+        result = MindOrchestrator().run(path)
+    except FileNotFoundError as e:
+        _finish(store, key, {"status": "failed", "error": str(e)})
+        raise
+    except Exception as e:
+        if task.request.retries >= task.max_retries:
+            _finish(store, key, {"status": "failed", "error": str(e)})
+            raise
+        logger.warning("Task %s failed, retrying: %s", task_id, e)
+        store.hset(key, mapping={"status": "retrying", "error": str(e)})
+        raise task.retry(exc=e)
+
+    _finish(
+        store,
+        key,
+        {
+            "status": "success",
+            "result": json.dumps(result, default=str),
+            "cost": f"{time.perf_counter() - start:.3f}",
+        },
+    )
+    return task_id
+
+
+if Celery is not None:
+    app = Celery("mind", broker=BROKER_URL)
+
+    @app.task(bind=True, max_retries=3, default_retry_delay=5)
+    def run_agent_blueprint(self, task_id: str, path: str) -> str:
+        """Run a blueprint through MindOrchestrator and record the outcome."""
+        return _run_blueprint_task(self, task_id, path)
+
+else:
+    app = None
+    run_agent_blueprint = None
+
+
+def submit_blueprint(path: str) -> str:
+    """Queue a blueprint run and return its task id.
+
+    Existing paths are sent as absolute paths, since workers resolve relative
+    ones against their own working directory.
+    """
+    _require_queue()
+    if Path(path).exists():
+        path = str(Path(path).resolve())
+    task_id = uuid.uuid4().hex
+    _state_store().hset(_state_key(task_id), mapping={"status": "queued", "path": path})
+    run_agent_blueprint.apply_async(args=(task_id, path), task_id=task_id)
+    logger.info("Queued blueprint %s as task %s", path, task_id)
+    return task_id
+
+
+def get_task_state(task_id: str) -> Dict[str, Any]:
+    """Return the recorded state of a queued run ({} if unknown)."""
+    _require_queue()
+    state: Dict[str, Any] = _state_store().hgetall(_state_key(task_id))
+    if "result" in state:
+        state["result"] = json.loads(state["result"])
+    return state
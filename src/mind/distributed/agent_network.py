@@ -70,7 +70,7 @@ class AgentNetwork:
 
         self._load_agents()
         logger.info(
-            f"AgentNetwork initialized: {network_name} ({len(self.agents)} agents)"
+            "AgentNetwork initialized: %s (%s agents)", network_name, len(self.agents)
         )
 
     def register_agent(
@@ -107,7 +107,7 @@ class AgentNetwork:
         self.connections[agent_id] = set()
         self._save_agent(agent)
 
-        logger.info(f"Agent registered: {name} ({agent_id}) at {host}:{port}")
+        logger.info("Agent registered: %s (%s) at %s:%s", name, agent_id, host, port)
         return agent_id
 
     def deregister_agent(self, agent_id: str) -> bool:
@@ -131,7 +131,7 @@ class AgentNetwork:
         for peers in self.connections.values():
             peers.discard(agent_id)
 
-        logger.info(f"Agent deregistered: {agent.name} ({agent_id})")
+        logger.info("Agent deregistered: %s (%s)", agent.name, agent_id)
         return True
 
     def get_agent(self, agent_id: str) -> Optional[AgentInfo]:
@@ -187,7 +187,7 @@ class AgentNetwork:
 
         if agent.status != "active":
             agent.status = "active"
-            logger.info(f"Agent recovered: {agent.name} ({agent_id})")
+            logger.info("Agent recovered: %s (%s)", agent.name, agent_id)
 
         return True
 
@@ -212,7 +212,7 @@ class AgentNetwork:
         self.connections[agent_id_1].add(agent_id_2)
         self.connections[agent_id_2].add(agent_id_1)
 
-        logger.info(f"Agents connected: {agent_id_1} <-> {agent_id_2}")
+        logger.info("Agents connected: %s <-> %s", agent_id_1, agent_id_2)
         return True
 
     def get_peers(self, agent_id: str) -> List[AgentInfo]:
@@ -285,7 +285,7 @@ class AgentNetwork:
         """Reset network state."""
         self.agents.clear()
         self.connections.clear()
-        logger.info(f"AgentNetwork reset: {self.network_name}")
+        logger.info("AgentNetwork reset: %s", self.network_name)
 
     # Private methods
 
@@ -311,7 +311,7 @@ class AgentNetwork:
             with open(self.network_file, "a") as f:
                 f.write(json.dumps(asdict(agent)) + "\n")
         except (OSError, IOError) as e:
-            logger.error(f"Error saving agent: {e}")
+            logger.error("Error saving agent: %s", e)
 
     def _save_topology(self, topology: NetworkTopology) -> None:
         """Save topology to file."""
@@ -329,7 +329,7 @@ class AgentNetwork:
             with open(self.topology_file, "a") as f:
                 f.write(json.dumps(data) + "\n")
         except (OSError, IOError) as e:
-            logger.error(f"Error saving topology: {e}")
+            logger.error("Error saving topology: %s", e)
 
     def _load_agents(self) -> None:
         """Load agents from file."""
@@ -347,4 +347,4 @@ class AgentNetwork:
                     except (json.JSONDecodeError, TypeError):
                         continue
         except (OSError, IOError) as e:
-            logger.error(f"Error loading agents: {e}")
+            logger.error("Error loading agents: %s", e)
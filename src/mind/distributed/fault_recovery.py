@@ -135,7 +135,7 @@ class FaultRecovery:
         ):
             cb.state = CircuitState.OPEN
             cb.state_change_time = datetime.now().isoformat()
-            logger.warning(f"Circuit opened for agent: {agent_id}")
+            logger.warning("Circuit opened for agent: %s", agent_id)
 
         return failure_id
 
@@ -160,7 +160,7 @@ class FaultRecovery:
                 cb.failure_count = 0
                 cb.success_count_since_open = 0
                 cb.state_change_time = datetime.now().isoformat()
-                logger.info(f"Circuit closed for agent: {agent_id}")
+                logger.info("Circuit closed for agent: %s", agent_id)
 
         elif cb.state == CircuitState.CLOSED:
             # Reset failure count on success
@@ -191,7 +191,7 @@ class FaultRecovery:
                     cb.state = CircuitState.HALF_OPEN
                     cb.success_count_since_open = 0
                     cb.state_change_time = datetime.now().isoformat()
-                    logger.info(f"Circuit half-open for agent: {agent_id}")
+                    logger.info("Circuit half-open for agent: %s", agent_id)
                     return True
 
             return False
@@ -222,7 +222,7 @@ class FaultRecovery:
             strategy: Callable to execute for recovery
         """
         self.recovery_strategies[agent_id] = strategy
-        logger.debug(f"Recovery strategy registered for agent: {agent_id}")
+        logger.debug("Recovery strategy registered for agent: %s", agent_id)
 
     def attempt_recovery(self, agent_id: str) -> bool:
         """Attempt to recover an agent.
@@ -239,10 +239,10 @@ class FaultRecovery:
         try:
             self.recovery_strategies[agent_id]()
             self.record_success(agent_id)
-            logger.info(f"Agent recovered: {agent_id}")
+            logger.info("Agent recovered: %s", agent_id)
             return True
         except Exception as e:
-            logger.error(f"Recovery failed for agent {agent_id}: {e}")
+            logger.error("Recovery failed for agent %s: %s", agent_id, e)
             return False
 
     def get_failure(self, failure_id: str) -> Optional[Failure]:
@@ -326,7 +326,7 @@ class FaultRecovery:
             with open(self.failures_file, "a") as f:
                 f.write(json.dumps(asdict(failure)) + "\n")
         except (OSError, IOError) as e:
-            logger.error(f"Error saving failure: {e}")
+            logger.error("Error saving failure: %s", e)
 
     def _load_failures(self) -> None:
         """Load failures from file."""
@@ -343,4 +343,4 @@ class FaultRecovery:
                     except (json.JSONDecodeError, TypeError):
                         continue
         except (OSError, IOError) as e:
-            logger.error(f"Error loading failures: {e}")
+            logger.error("Error loading failures: %s", e)
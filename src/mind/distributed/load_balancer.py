@@ -135,7 +135,9 @@ class LoadBalancer:
                 )
             self.agent_loads[agent_id].active_tasks += 1
 
-            logger.info(f"Task assigned: {task_id} -> {agent_id} ({strategy.value})")
+            logger.info(
+                "Task assigned: %s -> %s (%s)", task_id, agent_id, strategy.value
+            )
 
         return selected_agent
 
@@ -359,7 +361,7 @@ class LoadBalancer:
             with open(self.assignments_file, "a") as f:
                 f.write(json.dumps(asdict(assignment)) + "\n")
         except (OSError, IOError) as e:
-            logger.error(f"Error saving assignment: {e}")
+            logger.error("Error saving assignment: %s", e)
 
     def _load_assignments(self) -> None:
         """Load assignments from file."""
@@ -376,4 +378,4 @@ class LoadBalancer:
                     except (json.JSONDecodeError, TypeError):
                         continue
         except (OSError, IOError) as e:
-            logger.error(f"Error loading assignments: {e}")
+            logger.error("Error loading assignments: %s", e)
@@ -88,7 +88,7 @@ class RPCServer:
 
         self.calls_file = self.data_dir / f"{agent_id}_calls.jsonl"
         self._load_calls()
-        logger.info(f"RPCServer initialized for agent: {agent_id}")
+        logger.info("RPCServer initialized for agent: %s", agent_id)
 
         # Networking (typed as Optional to satisfy static type checks)
         from typing import Optional as _Opt
@@ -105,7 +105,7 @@ class RPCServer:
             method: Callable to execute
         """
         self.methods[name] = method
-        logger.debug(f"RPC method registered: {name}")
+        logger.debug("RPC method registered: %s", name)
 
     def handle_request(self, request_data: str) -> str:
         """Handle incoming RPC request.
@@ -358,7 +358,7 @@ class RPCServer:
                                 ctx.load_cert_chain(certfile=certfile, keyfile=keyfile)
                                 c = ctx.wrap_socket(c, server_side=True)
                             except Exception as e:
-                                logger.error(f"TLS handshake failed: {e}")
+                                logger.error("TLS handshake failed: %s", e)
                                 return
 
                         try:
@@ -427,7 +427,11 @@ class RPCServer:
         self._listening_thread = t
         bound_port = srv.getsockname()[1]
         logger.info(
-            f"RPCServer listening on {host}:{bound_port} framed={framed} tls={use_tls}"
+            "RPCServer listening on %s:%s framed=%s tls=%s",
+            host,
+            bound_port,
+            framed,
+            use_tls,
         )
         return bound_port
 
@@ -447,7 +451,7 @@ class RPCServer:
     def clear_history(self) -> None:
         """Clear call history."""
         self.call_history.clear()
-        logger.info(f"RPC call history cleared for agent: {self.agent_id}")
+        logger.info("RPC call history cleared for agent: %s", self.agent_id)
 
     # Private methods
 
@@ -476,7 +480,7 @@ class RPCServer:
             with open(self.calls_file, "a") as f:
                 f.write(json.dumps(asdict(call)) + "\n")
         except (OSError, IOError) as e:
-            logger.error(f"Error saving RPC call: {e}")
+            logger.error("Error saving RPC call: %s", e)
 
     def _load_calls(self) -> None:
         """Load call history from file."""
@@ -493,4 +497,4 @@ class RPCServer:
                     except (json.JSONDecodeError, TypeError):
                         continue
         except (OSError, IOError) as e:
-            logger.error(f"Error loading RPC calls: {e}")
+            logger.error("Error loading RPC calls: %s", e)
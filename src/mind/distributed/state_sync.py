@@ -71,7 +71,7 @@ class StateSync:
         self._load_state()
         self._load_versions()
         self._load_changes()
-        logger.info(f"StateSync initialized for agent: {agent_id}")
+        logger.info("StateSync initialized for agent: %s", agent_id)
 
     def set_state(self, key: str, value: Any) -> str:
         """Set a state value.
@@ -117,7 +117,9 @@ class StateSync:
         self._save_change(change)
         self._save_versions()
 
-        logger.debug(f"State updated: {key} (version {version_info.current_version})")
+        logger.debug(
+            "State updated: %s (version %s)", key, version_info.current_version
+        )
         return change_id
 
     def get_state(self, key: str) -> Any:
@@ -158,7 +160,10 @@ class StateSync:
             local_version = self.state_versions[key].current_version
             if version <= local_version:
                 logger.debug(
-                    f"Rejected state sync for {key}: version {version} <= {local_version}"
+                    "Rejected state sync for %s: version %s <= %s",
+                    key,
+                    version,
+                    local_version,
                 )
                 return False
 
@@ -170,7 +175,9 @@ class StateSync:
             self.replicas[source_agent_id] = {}
         self.replicas[source_agent_id][key] = value
 
-        logger.info(f"State synced from {source_agent_id}: {key} (version {version})")
+        logger.info(
+            "State synced from %s: %s (version %s)", source_agent_id, key, version
+        )
         return True
 
     def mark_propagated(self, change_id: str, agent_ids: List[str]) -> bool:
@@ -314,7 +321,7 @@ class StateSync:
             value: Value to accept
         """
         self.set_state(key, value)
-        logger.info(f"Conflict resolved for {key}: accepted value {value}")
+        logger.info("Conflict resolved for %s: accepted value %s", key, value)
 
     def reset(self) -> None:
         """Reset state synchronization."""
@@ -322,7 +329,7 @@ class StateSync:
         self.state_versions.clear()
         self.changes.clear()
         self.replicas.clear()
-        logger.info(f"StateSync reset for agent: {self.agent_id}")
+        logger.info("StateSync reset for agent: %s", self.agent_id)
 
     # Private methods
 
@@ -346,7 +353,7 @@ class StateSync:
             with open(self.state_file, "w") as f:
                 json.dump(self.local_state, f, default=str)
         except (OSError, IOError) as e:
-            logger.error(f"Error saving state: {e}")
+            logger.error("Error saving state: %s", e)
 
     def _save_versions(self) -> None:
         """Save versions to file."""
@@ -355,7 +362,7 @@ class StateSync:
             with open(self.versions_file, "w") as f:
                 json.dump(data, f, default=str)
         except (OSError, IOError) as e:
-            logger.error(f"Error saving versions: {e}")
+            logger.error("Error saving versions: %s", e)
 
     def _save_change(self, change: StateChange) -> None:
         """Save change to file."""
@@ -363,7 +370,7 @@ class StateSync:
             with open(self.changes_file, "a") as f:
                 f.write(json.dumps(asdict(change), default=str) + "\n")
         except (OSError, IOError) as e:
-            logger.error(f"Error saving change: {e}")
+            logger.error("Error saving change: %s", e)
 
     def _load_state(self) -> None:
         """Load state from file."""
@@ -374,7 +381,7 @@ class StateSync:
             with open(self.state_file, "r") as f:
                 self.local_state = json.load(f)
         except (OSError, IOError, json.JSONDecodeError) as e:
-            logger.error(f"Error loading state: {e}")
+            logger.error("Error loading state: %s", e)
 
     def _load_versions(self) -> None:
         """Load versions from file."""
@@ -387,7 +394,7 @@ class StateSync:
                 for key, version_data in data.items():
                     self.state_versions[key] = StateVersion(**version_data)
         except (OSError, IOError, json.JSONDecodeError) as e:
-            logger.error(f"Error loading versions: {e}")
+            logger.error("Error loading versions: %s", e)
 
     def _load_changes(self) -> None:
         """Load changes from file."""
@@ -404,4 +411,4 @@ class StateSync:
                     except (json.JSONDecodeError, TypeError):
                         continue
         except (OSError, IOError) as e:
-            logger.error(f"Error loading changes: {e}")
+            logger.error("Error loading changes: %s", e)
@@ -15,7 +15,7 @@ class AgentGenerator:
         agent_file = agents_dir / f"{component.name.lower()}.py"
         agent_code = self._create_agent_code(component)
         agent_file.write_text(agent_code)
-        logger.debug(f"Agent generated: {agent_file}")
+        logger.debug("Agent generated: %s", agent_file)
 
     def _create_agent_code(self, component: SystemComponent) -> str:
         """Create agent Python code."""
@@ -72,7 +72,7 @@ class DataModelGenerator:
         models_file = models_dir / "models.py"
         models_code = self._create_models_code(spec)
         models_file.write_text(models_code)
-        logger.debug(f"Models generated: {models_file}")
+        logger.debug("Models generated: %s", models_file)
 
     def _create_models_code(self, spec: SystemSpec) -> str:
         """Create data models code."""
@@ -130,7 +130,7 @@ class BlueprintGenerator:
         blueprint_file = blueprints_dir / "default_workflow.yaml"
         blueprint_code = self._create_blueprint(spec)
         blueprint_file.write_text(blueprint_code)
-        logger.debug(f"Blueprint generated: {blueprint_file}")
+        logger.debug("Blueprint generated: %s", blueprint_file)
 
     def _create_blueprint(self, spec: SystemSpec) -> str:
         """Create blueprint YAML."""
@@ -171,7 +171,7 @@ class OrchestrationGenerator:
         orch_file = core_dir / "orchestrator.py"
         orch_code = self._create_orchestrator(spec)
         orch_file.write_text(orch_code)
-        logger.debug(f"Orchestrator generated: {orch_file}")
+        logger.debug("Orchestrator generated: %s", orch_file)
 
     def _create_orchestrator(self, spec: SystemSpec) -> str:
         """Create orchestrator code."""
@@ -224,7 +224,7 @@ class TestGenerator:
         test_file = tests_dir / "test_system.py"
         test_code = self._create_tests(spec)
         test_file.write_text(test_code)
-        logger.debug(f"Tests generated: {test_file}")
+        logger.debug("Tests generated: %s", test_file)
 
     def _create_tests(self, spec: SystemSpec) -> str:
         """Create test code."""
@@ -32,7 +32,7 @@ class RepositoryInitializer:
 
         self.parent_dir = Path(parent_dir)
         self.parent_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"RepositoryInitializer initialized: {self.parent_dir}")
+        logger.info("RepositoryInitializer initialized: %s", self.parent_dir)
 
     def create_system_repository(
         self,
@@ -56,7 +56,7 @@ class RepositoryInitializer:
         repo_path = self.parent_dir / f"{system_name}_{system_id}"
         repo_path.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Creating repository: {repo_path}")
+        logger.info("Creating repository: %s", repo_path)
 
         try:
             # Initialize Git repo
@@ -86,7 +86,7 @@ class RepositoryInitializer:
             # Initialize branches
             self._setup_branches(repo_path)
 
-            logger.info(f"Repository created successfully: {repo_path}")
+            logger.info("Repository created successfully: %s", repo_path)
 
             return {
                 "repo_path": str(repo_path),
@@ -103,7 +103,7 @@ class RepositoryInitializer:
             }
 
         except Exception as e:
-            logger.error(f"Failed to create repository: {e}")
+            logger.error("Failed to create repository: %s", e)
             raise
 
     def _init_git_repo(self, repo_path: Path) -> None:
@@ -115,7 +115,7 @@ class RepositoryInitializer:
                 check=True,
                 capture_output=True,
             )
-            logger.debug(f"Git repository initialized: {repo_path}")
+            logger.debug("Git repository initialized: %s", repo_path)
 
             # Configure Git (use system git config if available, otherwise local)
             subprocess.run(
@@ -131,7 +131,7 @@ class RepositoryInitializer:
                 capture_output=True,
             )
         except subprocess.CalledProcessError as e:
-            logger.error(f"Git initialization failed: {e}")
+            logger.error("Git initialization failed: %s", e)
             raise
 
     def _create_structure(self, repo_path: Path) -> None:
@@ -156,7 +156,7 @@ class RepositoryInitializer:
         (repo_path / "core" / "__init__.py").touch()
         (repo_path / "tests" / "__init__.py").touch()
 
-        logger.debug(f"Directory structure created: {repo_path}")
+        logger.debug("Directory structure created: %s", repo_path)
 
     def _create_gitignore(self, repo_path: Path, system_type: str) -> None:
         """Generate appropriate .gitignore file.
@@ -229,7 +229,7 @@ docs/_build/
 """
         gitignore_path = repo_path / ".gitignore"
         gitignore_path.write_text(gitignore_content)
-        logger.debug(f"Gitignore created: {gitignore_path}")
+        logger.debug("Gitignore created: %s", gitignore_path)
 
     def _create_readme(
         self, repo_path: Path, system_name: str, spec: SystemSpec
@@ -456,7 +456,7 @@ To update this system in the future:
 
         readme_path = repo_path / "README.md"
         readme_path.write_text(readme_content)
-        logger.debug(f"README created: {readme_path}")
+        logger.debug("README created: %s", readme_path)
         return readme_path
 
     def _create_metadata(
@@ -512,7 +512,7 @@ To update this system in the future:
         with open(metadata_path, "w") as f:
             json.dump(metadata, f, indent=2)
 
-        logger.debug(f"Metadata created: {metadata_path}")
+        logger.debug("Metadata created: %s", metadata_path)
         return metadata
 
     def _create_initial_commit(
@@ -561,11 +561,11 @@ To update this system in the future:
             )
             commit_hash = result.stdout.strip()
 
-            logger.debug(f"Initial commit created: {commit_hash}")
+            logger.debug("Initial commit created: %s", commit_hash)
             return commit_hash
 
         except subprocess.CalledProcessError as e:
-            logger.error(f"Commit creation failed: {e}")
+            logger.error("Commit creation failed: %s", e)
             raise
 
     def _setup_branches(self, repo_path: Path) -> None:
@@ -602,5 +602,5 @@ To update this system in the future:
             logger.debug("Branches initialized: main, dev")
 
         except subprocess.CalledProcessError as e:
-            logger.error(f"Branch setup failed: {e}")
+            logger.error("Branch setup failed: %s", e)
             raise
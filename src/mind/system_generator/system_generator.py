@@ -130,8 +130,8 @@ class SystemGenerator:
         self.orch_gen = OrchestrationGenerator()
         self.test_gen = TestGenerator()
 
-        logger.info(f"SystemGenerator initialized: {self.base_dir}")
-        logger.info(f"System registry: {self.registry.get_registry_path()}")
+        logger.info("SystemGenerator initialized: %s", self.base_dir)
+        logger.info("System registry: %s", self.registry.get_registry_path())
 
     def create(
         self,
@@ -165,7 +165,10 @@ class SystemGenerator:
         system_name = name.lower().replace(" ", "_")
 
         logger.info(
-            f"Creating independent system: {name} (id={system_id}, type={system_type})"
+            "Creating independent system: %s (id=%s, type=%s)",
+            name,
+            system_id,
+            system_type,
         )
 
         # Create specification
@@ -187,7 +190,7 @@ class SystemGenerator:
         self._design_architecture(spec)
 
         # Create independent Git repository
-        logger.info(f"Initializing Git repository for system: {system_name}")
+        logger.info("Initializing Git repository for system: %s", system_name)
         repo_info = self.repo_manager.create_system_repository(
             system_name, system_id, spec, system_type
         )
@@ -196,7 +199,7 @@ class SystemGenerator:
         repo_path = Path(repo_info["repo_path"])
 
         # Generate all system code in the new repository
-        logger.info(f"Generating system code in repository: {repo_path}")
+        logger.info("Generating system code in repository: %s", repo_path)
         self._generate_code(repo_path, spec)
 
         # Register system in Mind's registry
@@ -212,7 +215,7 @@ class SystemGenerator:
         # Create GeneratedSystem instance
         system = GeneratedSystem(spec, repo_path, system_id, repo_info, registry_entry)
 
-        logger.info(f"System created successfully: {system_name} -> {repo_path}")
+        logger.info("System created successfully: %s -> %s", system_name, repo_path)
         logger.info("Registry entry: ~/.mind/system_registry/systems.json")
 
         return system
@@ -233,7 +236,7 @@ class SystemGenerator:
 
     def _design_architecture(self, spec: SystemSpec) -> None:
         """Design the system architecture based on spec."""
-        logger.debug(f"Designing architecture for: {spec.name}")
+        logger.debug("Designing architecture for: %s", spec.name)
 
         # Always include core components
         core_components = [
@@ -278,7 +281,7 @@ class SystemGenerator:
             )
             spec.add_component(component)
 
-        logger.debug(f"Architecture designed with {len(spec.components)} components")
+        logger.debug("Architecture designed with %s components", len(spec.components))
 
     def _generate_code(self, system_dir: Path, spec: SystemSpec) -> None:
         """Generate all system code in the repository.
@@ -287,7 +290,7 @@ class SystemGenerator:
             system_dir: System repository root directory
             spec: System specification
         """
-        logger.info(f"Generating code for: {spec.name}")
+        logger.info("Generating code for: %s", spec.name)
 
         # Generate agents
         agents_dir = system_dir / "agents"
@@ -317,7 +320,7 @@ class SystemGenerator:
         # Generate requirements file
         self._generate_requirements(system_dir, spec)
 
-        logger.info(f"Code generation complete: {system_dir}")
+        logger.info("Code generation complete: %s", system_dir)
 
     def _generate_requirements(self, system_dir: Path, spec: SystemSpec) -> None:
         """Generate requirements.txt for the system.
@@ -351,7 +354,7 @@ class SystemGenerator:
 
         requirements_path = system_dir / "requirements.txt"
         requirements_path.write_text("\n".join(requirements) + "\n")
-        logger.debug(f"Requirements file generated: {requirements_path}")
+        logger.debug("Requirements file generated: %s", requirements_path)
 
     def _generate_cli(self, system_dir: Path, spec: SystemSpec) -> None:
         """Generate system CLI entrypoint.
@@ -417,4 +420,4 @@ if __name__ == "__main__":
     run()
 '''
         cli_file.write_text(cli_code)
-        logger.debug(f"CLI generated: {cli_file}")
+        logger.debug("CLI generated: %s", cli_file)
@@ -34,7 +34,7 @@ class SystemRegistry:
         self.registry_file = self.registry_dir / "systems.json"
         self._load_registry()
 
-        logger.info(f"SystemRegistry initialized: {self.registry_dir}")
+        logger.info("SystemRegistry initialized: %s", self.registry_dir)
 
     def _load_registry(self) -> None:
         """Load existing registry from disk."""
@@ -42,9 +42,9 @@ class SystemRegistry:
             try:
                 with open(self.registry_file, "r") as f:
                     self.systems = json.load(f)
-                logger.debug(f"Loaded registry with {len(self.systems)} systems")
+                logger.debug("Loaded registry with %s systems", len(self.systems))
             except Exception as e:
-                logger.error(f"Failed to load registry: {e}")
+                logger.error("Failed to load registry: %s", e)
                 self.systems = {}
         else:
             self.systems = {}
@@ -56,7 +56,7 @@ class SystemRegistry:
                 json.dump(self.systems, f, indent=2)
             logger.debug("Registry saved")
         except Exception as e:
-            logger.error(f"Failed to save registry: {e}")
+            logger.error("Failed to save registry: %s", e)
             raise
 
     def register_system(
@@ -91,7 +91,7 @@ class SystemRegistry:
         self.systems[system_id] = entry
         self._save_registry()
 
-        logger.info(f"System registered: {system_id} ({system_name})")
+        logger.info("System registered: %s (%s)", system_id, system_name)
 
     def get_system(self, system_id: str) -> Optional[Dict[str, Any]]:
         """Get system registry entry.
@@ -136,7 +136,7 @@ class SystemRegistry:
         if system_id in self.systems:
             self.systems[system_id]["status"] = status
             self._save_registry()
-            logger.info(f"System status updated: {system_id} -> {status}")
+            logger.info("System status updated: %s -> %s", system_id, status)
 
     def archive_system(self, system_id: str) -> None:
         """Archive a system (mark as inactive).
@@ -163,9 +163,9 @@ class SystemRegistry:
         try:
             with open(export_path, "w") as f:
                 json.dump(self.systems, f, indent=2)
-            logger.info(f"Registry exported: {export_path}")
+            logger.info("Registry exported: %s", export_path)
         except Exception as e:
-            logger.error(f"Export failed: {e}")
+            logger.error("Export failed: %s", e)
             raise
 
     def get_registry_summary(self) -> Dict[str, Any]:
@@ -1,12 +1,104 @@
 import logging
+import sys
+import threading
+from logging.handlers import MemoryHandler
+
+# Records are buffered and written in batches instead of one write per line.
+# Every logger shares one buffer, so records keep their global order. WARNING
+# and above bypass the buffer, and a timer writes out anything left buffered
+# after FLUSH_INTERVAL, so quiet long-running processes never sit on records.
+# An interactive terminal gets each record at once, in step with print()
+# output. logging.shutdown() (registered with atexit by the logging module)
+# flushes whatever is left on exit.
+BUFFER_CAPACITY = 256
+FLUSH_INTERVAL = 0.5  # seconds
+
+
+class _StderrHandler(logging.StreamHandler):
+    """StreamHandler that follows sys.stderr until given another stream.
+
+    Buffered records may be written long after the handler was created, by
+    which point sys.stderr may have been swapped (e.g. by test capture).
+    """
+
+    def __init__(self):
+        super().__init__(sys.stderr)
+        self._stderr = self.stream
+
+    def _follow_stderr(self) -> None:
+        # A stream set through setStream() or assignment is left alone
+        if self.stream is self._stderr and self.stream is not sys.stderr:
+            self.stream = self._stderr = sys.stderr
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._follow_stderr()
+        super().emit(record)
+
+    def flush(self) -> None:
+        self._follow_stderr()
+        super().flush()
+
+
+class BufferedHandler(MemoryHandler):
+    """MemoryHandler that also flushes records buffered for `flush_interval`."""
+
+    def __init__(self, target: logging.Handler, capacity: int, flush_interval: float):
+        super().__init__(capacity, flushLevel=logging.WARNING, target=target)
+        self.flush_interval = flush_interval
+        self._timer = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        # Called with self.lock held, as is flush(), so the timer is only
+        # started for the first record of a batch.
+        if self.buffer and self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._cancel_timer()
+            super().flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            self._cancel_timer()
+        finally:
+            self.release()
+        super().close()
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def _shared_handler() -> BufferedHandler:
+    """Return the buffered handler every logger writes through, creating it once."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            handler = _StderrHandler()
+            formatter = logging.Formatter("[%(levelname)s] %(name)s: %(message)s")
+            handler.setFormatter(formatter)
+            isatty = getattr(sys.stderr, "isatty", None)
+            capacity = 1 if isatty is not None and isatty() else BUFFER_CAPACITY
+            _shared = BufferedHandler(handler, capacity, FLUSH_INTERVAL)
+    return _shared
 
 
 def get_logger(name: str):
     logger = logging.getLogger(name)
     if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter("[%(levelname)s] %(name)s: %(message)s")
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        logger.addHandler(_shared_handler())
     logger.setLevel(logging.INFO)
     return logger
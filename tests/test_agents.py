@@ -1,7 +1,14 @@
+import logging
+from collections import deque
+
+from mind.agents.base_agent import BaseAgent
 from mind.agents.goal_interpreter_agent import GoalInterpreterAgent
 from mind.agents.system_designer_agent import SystemDesignerAgent
 from mind.agents.boundary_setter_agent import BoundarySetterAgent
 from mind.agents.evaluator_agent import EvaluatorAgent
+from mind.agents.evolution_engine_agent import EvolutionEngineAgent
+from mind.agents.echo_agent import EchoAgent
+from mind.agents.types import EchoResponse, Evaluation
 
 
 class TestGoalInterpreterAgent:
@@ -12,7 +19,7 @@ class TestGoalInterpreterAgent:
         agent = GoalInterpreterAgent()
         assert agent.name == "goal_interpreter_agent"
         assert agent.description is not None
-        assert isinstance(agent.history, list)
+        assert isinstance(agent.history, deque)
 
     def test_goal_interpreter_basic_run(self):
         """Test basic goal interpretation."""
@@ -32,6 +39,27 @@ class TestGoalInterpreterAgent:
         assert len(result["constraints"]) > 0
         assert any("privacy" in c.lower() for c in result["constraints"])
 
+    def test_goal_interpreter_constraint_sentences(self):
+        """Test that only sentences with constraint keywords are kept."""
+        agent = GoalInterpreterAgent()
+        result = agent.run("Build a tool. Keep the BUDGET small. Ship it.")
+        assert result["constraints"] == ["Keep the BUDGET small."]
+
+    def test_goal_interpreter_constraints_with_unicode_lowercasing(self):
+        """Test constraint scan when lowercasing changes the text length."""
+        agent = GoalInterpreterAgent()
+        result = agent.run("İstanbul is far. Keep it local.")
+        assert result["constraints"] == ["Keep it local."]
+
+    def test_goal_interpreter_repeated_input_uses_cache(self):
+        """Test that a repeated goal is served from the Doc cache."""
+        agent = GoalInterpreterAgent()
+        first = agent.run("Keep it local. Build a tool.")
+        assert len(agent._doc_cache) == 1
+        second = agent.run("Keep it local. Build a tool.")
+        assert len(agent._doc_cache) == 1
+        assert second == first
+
     def test_goal_interpreter_history(self):
         """Test that agent logs entries to history."""
         agent = GoalInterpreterAgent()
@@ -39,6 +67,40 @@ class TestGoalInterpreterAgent:
         agent.run("Test goal")
         assert len(agent.history) > initial_history_len
 
+    def test_goal_interpreter_shares_nlp_pipeline(self):
+        """Test that the spaCy pipeline is loaded once and shared."""
+        first = GoalInterpreterAgent()
+        second = GoalInterpreterAgent()
+        first.run("Build a subsystem for Mind.")
+        assert first._nlp_factory() is second._nlp_factory()
+
+
+class TestBaseAgent:
+    """Test suite for BaseAgent logging."""
+
+    def test_log_formats_when_enabled(self):
+        """Test that log arguments are formatted into history."""
+        agent = BaseAgent("log_enabled_agent", "test")
+        agent.log("Value: %s", [1, 2])
+        assert agent.history[-1] == "Value: [1, 2]"
+
+    def test_log_skips_when_disabled(self):
+        """Test that nothing is formatted when INFO is disabled."""
+        agent = BaseAgent("log_disabled_agent", "test")
+        agent.logger.setLevel(logging.WARNING)
+
+        class Exploding:
+            def __str__(self):
+                raise AssertionError("formatted while disabled")
+
+        agent.log("Value: %s", Exploding())
+        assert len(agent.history) == 0
+
+    def test_agents_have_no_instance_dict(self):
+        """Test that slotted agents do not carry a per-instance __dict__."""
+        for agent in (BaseAgent("slotted_agent", "test"), EvaluatorAgent()):
+            assert not hasattr(agent, "__dict__")
+
 
 class TestSystemDesignerAgent:
     """Test suite for SystemDesignerAgent."""
@@ -70,6 +132,7 @@ class TestBoundarySetterAgent:
         result = agent.run(architecture, constraints)
         assert "boundaries" in result
         assert result["boundaries"] == constraints
+        assert "boundaries" not in architecture
 
 
 class TestEvaluatorAgent:
@@ -83,11 +146,10 @@ class TestEvaluatorAgent:
             "complexity": "medium",
         }
         result = agent.run(system_output)
-        assert isinstance(result, dict)
-        assert "score" in result
-        assert "issues" in result
-        assert "suggestions" in result
-        assert result["score"] > 0
+        assert isinstance(result, Evaluation)
+        assert result.score > 0
+        assert result.issues == []
+        assert result.suggestions == []
 
     def test_evaluator_handles_high_complexity(self):
         """Test evaluator with high complexity."""
@@ -97,4 +159,40 @@ class TestEvaluatorAgent:
             "complexity": "high",
         }
         result = agent.run(system_output)
-        assert len(result["issues"]) > 0
+        assert len(result.issues) > 0
+
+    def test_evaluator_unclear_complexity(self):
+        """Test evaluator with few components and unknown complexity."""
+        agent = EvaluatorAgent()
+        result = agent.run({"components": ["a"]})
+        assert result.score == 1
+        assert result.issues == []
+        assert result.suggestions == [
+            "Add more explicit components for clarity.",
+            "Clarify complexity level.",
+        ]
+
+
+class TestEvolutionEngineAgent:
+    """Test suite for EvolutionEngineAgent."""
+
+    def test_evolution_engine_uses_evaluation(self):
+        """Test that evolution plan reacts to a low-scoring evaluation."""
+        agent = EvolutionEngineAgent()
+        evaluation = Evaluation(score=1, issues=["Too complex."])
+        result = agent.run(evaluation)
+        assert "Refine component boundaries." in result["improvements"]
+        assert "Address listed issues before implementation." in result["next_steps"]
+
+
+class TestEchoAgent:
+    """Test suite for EchoAgent."""
+
+    def test_echo_agent_returns_context(self):
+        """Test that echo agent hands back what it received."""
+        agent = EchoAgent("echo")
+        context = {"action": "ping", "context": {}}
+        result = agent.act(context)
+        assert isinstance(result, EchoResponse)
+        assert result.agent == "echo"
+        assert result.received is context
@@ -0,0 +1,85 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("requests")
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts/benchmark_llm_matrix.py"
+
+
+@pytest.fixture(scope="module")
+def benchmark():
+    """Load the benchmark script as a module."""
+    spec = importlib.util.spec_from_file_location("benchmark_llm_matrix", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        sys.modules.pop(spec.name, None)
+
+
+class TestTryParseJson:
+    """Test suite for try_parse_json."""
+
+    def test_object_after_prose(self, benchmark):
+        """Test that prose around a complete object is skipped."""
+        assert benchmark.try_parse_json('Result: {"a": 1} done') == {"a": 1}
+
+    def test_invalid_braces_before_object(self, benchmark):
+        """Test that a balanced non-JSON brace span before the object is skipped."""
+        assert benchmark.try_parse_json('use {x} here: {"a": 1}') == {"a": 1}
+
+    def test_truncated_object_with_complete_nested_object(self, benchmark):
+        """Test that a cut-off object does not yield one of its nested objects."""
+        text = '{"scene": {"id": 1, "mood": "tense"}, "beats": ["open", "cl'
+        assert benchmark.try_parse_json(text) is None
+
+
+class TestLocalJsonRepair:
+    """Test suite for local_json_repair."""
+
+    def test_valid_json(self, benchmark):
+        """Test that valid JSON is parsed unchanged."""
+        assert benchmark.local_json_repair('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_code_fence(self, benchmark):
+        """Test that a markdown code fence and its chatter are stripped."""
+        text = 'Here you go:\n```json\n{"a": 1}\n```\nAnything else?'
+        assert benchmark.local_json_repair(text) == {"a": 1}
+
+    def test_smart_quotes(self, benchmark):
+        """Test that smart-quoted strings become JSON strings."""
+        text = "{“a”: “b”}"
+        assert benchmark.local_json_repair(text) == {"a": "b"}
+
+    def test_trailing_commas(self, benchmark):
+        """Test that trailing commas in objects and arrays are dropped."""
+        assert benchmark.local_json_repair('{"a": [1, 2,], "b": 3,}') == {
+            "a": [1, 2],
+            "b": 3,
+        }
+
+    def test_escaped_single_quote(self, benchmark):
+        """Test that an escaped quote inside a single-quoted string is kept."""
+        assert benchmark.local_json_repair("{'a': 'it\\'s'}") == {"a": "it's"}
+
+    def test_double_quote_in_single_quoted_string(self, benchmark):
+        """Test that a double quote inside a single-quoted string is escaped."""
+        text = "{'a': 'say \"hi\"'}"
+        assert benchmark.local_json_repair(text) == {"a": 'say "hi"'}
+
+    def test_commas_inside_strings_are_kept(self, benchmark):
+        """Test that a comma before a bracket inside a string is not removed."""
+        assert benchmark.local_json_repair('{"a": "x,}",}') == {"a": "x,}"}
+
+    def test_no_json(self, benchmark):
+        """Test that text without an object is not repaired."""
+        assert benchmark.local_json_repair("no json here") is None
+
+    def test_non_object(self, benchmark):
+        """Test that a top-level array is not accepted."""
+        assert benchmark.local_json_repair("[1, 2]") is None
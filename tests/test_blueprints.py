@@ -1,5 +1,7 @@
+import json
+
 import pytest
-from mind.core.blueprint_loader import BlueprintLoader
+from mind.core.blueprint_loader import BlueprintLoader, _parse_blueprint
 
 
 class TestBlueprintLoader:
@@ -47,3 +49,76 @@ class TestBlueprintLoader:
         loader = BlueprintLoader()
         with pytest.raises(FileNotFoundError):
             loader.load("nonexistent/blueprint.yaml")
+
+    def test_blueprint_load_is_cached(self):
+        """Test that repeated loads of an unchanged file reuse the parse."""
+        loader = BlueprintLoader()
+        first = loader.load("blueprints/meta_system.yaml")
+        hits = _parse_blueprint.cache_info().hits
+        second = loader.load("blueprints/meta_system.yaml")
+        assert _parse_blueprint.cache_info().hits == hits + 1
+        assert first == second
+
+    def test_blueprint_load_returns_independent_copies(self):
+        """Test that changing one loaded blueprint does not affect later loads."""
+        loader = BlueprintLoader()
+        first = loader.load("blueprints/meta_system.yaml")
+        expected = len(first["constraints"])
+        first["constraints"].append("added by caller")
+        first["goal"]["raw_text"] = "changed"
+
+        second = loader.load("blueprints/meta_system.yaml")
+        assert len(second["constraints"]) == expected
+        assert second["goal"]["raw_text"] != "changed"
+
+    def test_blueprint_reloads_after_change(self, tmp_path):
+        """Test that editing a blueprint invalidates the cached parse."""
+        import os
+
+        path = tmp_path / "bp.yaml"
+        path.write_text("goal:\n  raw_text: first\n")
+        loader = BlueprintLoader()
+        assert loader.load(str(path))["goal"]["raw_text"] == "first"
+
+        path.write_text("goal:\n  raw_text: second\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert loader.load(str(path))["goal"]["raw_text"] == "second"
+
+    def test_blueprint_compiled_to_json(self, tmp_path):
+        """Test that a blueprint is compiled to JSON and reused from it."""
+        cache_dir = tmp_path / "cache"
+        path = tmp_path / "bp.yaml"
+        path.write_text("goal:\n  raw_text: compiled\npipeline: []\n")
+
+        bp = BlueprintLoader(cache_dir=cache_dir).load(str(path))
+        compiled = list(cache_dir.glob("*.json"))
+        assert len(compiled) == 1
+        assert json.loads(compiled[0].read_text()) == bp
+
+        # A new process (empty in-memory cache) reads the compiled copy
+        compiled[0].write_text(json.dumps({"goal": {"raw_text": "from json"}}))
+        _parse_blueprint.cache_clear()
+        other = BlueprintLoader(cache_dir=cache_dir).load(str(path))
+        assert other["goal"]["raw_text"] == "from json"
+
+    def test_blueprint_default_writes_no_cache(self, tmp_path, monkeypatch):
+        """Test that a default loader keeps compiled blueprints off disk."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        path = tmp_path / "bp.yaml"
+        path.write_text("goal:\n  raw_text: no cache\n")
+
+        loader = BlueprintLoader()
+        assert loader.cache_dir is None
+        assert loader.load(str(path))["goal"]["raw_text"] == "no cache"
+        assert list(tmp_path.rglob("*.json")) == []
+
+    def test_blueprint_cache_dir_from_env(self, tmp_path, monkeypatch):
+        """Test that MIND_BLUEPRINT_CACHE enables the compiled JSON cache."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv("MIND_BLUEPRINT_CACHE", str(cache_dir))
+        path = tmp_path / "bp.yaml"
+        path.write_text("goal:\n  raw_text: env cache\n")
+
+        BlueprintLoader().load(str(path))
+        assert len(list(cache_dir.glob("*.json"))) == 1
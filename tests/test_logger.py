@@ -0,0 +1,114 @@
+import io
+import logging
+import time
+
+from mind.utils import logger as logger_module
+from mind.utils.logger import BufferedHandler, _StderrHandler, get_logger
+
+
+def _buffered(capacity=256, flush_interval=60.0):
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    target.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    return BufferedHandler(target, capacity, flush_interval), stream
+
+
+def _record(level, message):
+    return logging.LogRecord("test", level, __file__, 0, message, None, None)
+
+
+class TestBufferedHandler:
+    """Test suite for the buffered log handler."""
+
+    def test_info_is_buffered(self):
+        """Test that INFO records wait in the buffer."""
+        handler, stream = _buffered()
+        handler.handle(_record(logging.INFO, "quiet"))
+        assert stream.getvalue() == ""
+        handler.close()
+        assert "INFO quiet" in stream.getvalue()
+
+    def test_warning_flushes_immediately(self):
+        """Test that a WARNING writes itself and everything buffered before it."""
+        handler, stream = _buffered()
+        handler.handle(_record(logging.INFO, "first"))
+        handler.handle(_record(logging.WARNING, "careful"))
+        assert stream.getvalue().splitlines() == ["INFO first", "WARNING careful"]
+        handler.close()
+
+    def test_buffer_flushes_without_further_records(self):
+        """Test that buffered records are written even if nothing else is logged."""
+        handler, stream = _buffered(flush_interval=0.05)
+        handler.handle(_record(logging.INFO, "idle"))
+        deadline = time.monotonic() + 2
+        while not stream.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "INFO idle" in stream.getvalue()
+        handler.close()
+
+
+class TestStderrHandler:
+    """Test suite for the stderr-following stream handler."""
+
+    def test_follows_swapped_stderr(self, monkeypatch):
+        """Test that records go to the current sys.stderr."""
+        handler = _StderrHandler()
+        swapped = io.StringIO()
+        monkeypatch.setattr("sys.stderr", swapped)
+        handler.handle(_record(logging.INFO, "to stderr"))
+        assert "to stderr" in swapped.getvalue()
+
+    def test_set_stream_is_respected(self, monkeypatch):
+        """Test that an explicitly set stream is not replaced by sys.stderr."""
+        handler = _StderrHandler()
+        chosen = io.StringIO()
+        handler.setStream(chosen)
+        monkeypatch.setattr("sys.stderr", io.StringIO())
+        handler.handle(_record(logging.INFO, "kept"))
+        assert "kept" in chosen.getvalue()
+
+
+class TestGetLogger:
+    """Test suite for get_logger's shared buffer."""
+
+    def test_loggers_keep_global_order(self, monkeypatch):
+        """Test that a WARNING on one logger does not jump ahead of another's INFO."""
+        stream = io.StringIO()
+        monkeypatch.setattr("sys.stderr", stream)
+        monkeypatch.setattr(logger_module, "_shared", None)
+        first = get_logger("test_logger.order.first")
+        second = get_logger("test_logger.order.second")
+        try:
+            first.info("one")
+            second.info("two")
+            assert stream.getvalue() == ""
+            first.warning("three")
+            assert stream.getvalue().splitlines() == [
+                "[INFO] test_logger.order.first: one",
+                "[INFO] test_logger.order.second: two",
+                "[WARNING] test_logger.order.first: three",
+            ]
+        finally:
+            handler = logger_module._shared
+            for logger in (first, second):
+                logger.removeHandler(handler)
+            handler.close()
+
+    def test_terminal_is_not_buffered(self, monkeypatch):
+        """Test that records reach an interactive terminal immediately."""
+
+        class _Terminal(io.StringIO):
+            def isatty(self):
+                return True
+
+        stream = _Terminal()
+        monkeypatch.setattr("sys.stderr", stream)
+        monkeypatch.setattr(logger_module, "_shared", None)
+        logger = get_logger("test_logger.terminal")
+        try:
+            logger.info("now")
+            assert stream.getvalue() == "[INFO] test_logger.terminal: now\n"
+        finally:
+            handler = logger_module._shared
+            logger.removeHandler(handler)
+            handler.close()
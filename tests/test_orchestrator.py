@@ -1,4 +1,10 @@
-from mind.core.meta_orchestrator import MetaOrchestrator
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from mind.core import mind_orchestrator, tasks
+from mind.core.meta_orchestrator import MetaOrchestrator, _group_stages
 from mind.core.mind_orchestrator import MindOrchestrator
 
 
@@ -55,6 +61,59 @@ class TestMetaOrchestrator:
         # The final output should have architectural information
         assert final_output is not None
 
+    def test_meta_pipeline_groups_independent_stages(self):
+        """Test that consecutive independent stages are batched together."""
+        pipeline = [
+            {"agent": "system_designer_agent"},
+            {"agent": "boundary_setter_agent"},
+            {"agent": "tool_selector_agent"},
+            {"agent": "evaluator_agent"},
+        ]
+        groups = _group_stages(pipeline)
+        assert [len(g) for g in groups] == [1, 2, 1]
+
+    def test_meta_pipeline_merges_parallel_stage_outputs(self, tmp_path):
+        """Test that outputs of concurrently run stages are all merged."""
+        blueprint = tmp_path / "planning.yaml"
+        blueprint.write_text(
+            "goal:\n"
+            "  raw_text: \"Build a local tool.\"\n"
+            "constraints:\n"
+            "  - \"Stay local.\"\n"
+            "pipeline:\n"
+            "  - agent: goal_interpreter_agent\n"
+            "  - agent: system_designer_agent\n"
+            "  - agent: boundary_setter_agent\n"
+            "  - agent: tool_selector_agent\n"
+            "  - agent: agent_architect_agent\n"
+            "  - agent: execution_planner_agent\n"
+        )
+        meta = MetaOrchestrator()
+        result = meta.run_blueprint(str(blueprint))
+        architecture = result["final_output"]
+        assert architecture["boundaries"] == ["Stay local."]
+        assert "tools" in architecture
+        assert "agents" in architecture
+        assert "execution_plan" in architecture
+        assert "components" in architecture
+
+    def test_meta_pipeline_result_mutation_does_not_leak(self):
+        """Test that changing one run's result leaves later runs unaffected."""
+        meta = MetaOrchestrator()
+        first = meta.run_blueprint("blueprints/meta_system.yaml")
+        expected = list(first["constraints"])
+        first["constraints"].append("added by caller")
+
+        second = meta.run_blueprint("blueprints/meta_system.yaml")
+        assert second["constraints"] == expected
+
+    def test_meta_pipeline_plan_is_reused(self):
+        """Test that a pipeline is compiled once and reused."""
+        meta = MetaOrchestrator()
+        meta.run_blueprint("blueprints/meta_system.yaml")
+        meta.run_blueprint("blueprints/meta_system.yaml")
+        assert len(meta._plans) == 1
+
 
 class TestMindOrchestrator:
     """Test suite for MindOrchestrator."""
@@ -116,3 +175,111 @@ class TestMindOrchestrator:
         assert len(orchestrator.memory["goals"]) > initial_memory
         assert len(orchestrator.memory["architectures"]) > 0
         assert len(orchestrator.memory["evolutions"]) > 0
+
+
+class _FakeStore:
+    """In-memory stand-in for the Redis task-state hashes."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.ttls = {}
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+class _RetryRequested(Exception):
+    pass
+
+
+class _FakeTask:
+    """Bound-task stand-in exposing what the task body reads."""
+
+    max_retries = 3
+
+    def __init__(self, retries=0):
+        self.request = SimpleNamespace(retries=retries)
+
+    def retry(self, exc):
+        return _RetryRequested(exc)
+
+
+class _FakeOrchestrator:
+    error = None
+
+    def run(self, path):
+        if self.error is not None:
+            raise self.error
+        return {"path": path}
+
+
+class TestBlueprintTasks:
+    """Test suite for queued blueprint runs."""
+
+    def test_submit_requires_queue_dependencies(self, monkeypatch):
+        """Test that submitting without celery gives a clear error."""
+        monkeypatch.setattr(tasks, "Celery", None)
+        with pytest.raises(RuntimeError, match="celery"):
+            tasks.submit_blueprint("blueprints/meta_system.yaml")
+
+    @pytest.fixture
+    def store(self, monkeypatch):
+        store = _FakeStore()
+        monkeypatch.setattr(tasks, "_state_store", lambda: store)
+        monkeypatch.setattr(mind_orchestrator, "MindOrchestrator", _FakeOrchestrator)
+        monkeypatch.setattr(_FakeOrchestrator, "error", None)
+        return store
+
+    def test_task_success_records_result_with_ttl(self, store):
+        """Test that a successful run is stored as success and expires."""
+        assert tasks._run_blueprint_task(_FakeTask(), "t1", "/bp.yaml") == "t1"
+        state = store.hashes["task:t1"]
+        assert state["status"] == "success"
+        assert json.loads(state["result"]) == {"path": "/bp.yaml"}
+        assert store.ttls["task:t1"] == tasks.TASK_STATE_TTL
+
+    def test_task_error_is_retried(self, store):
+        """Test that a failure with retries left is marked retrying."""
+        _FakeOrchestrator.error = RuntimeError("model busy")
+        with pytest.raises(_RetryRequested):
+            tasks._run_blueprint_task(_FakeTask(retries=0), "t2", "/bp.yaml")
+        assert store.hashes["task:t2"]["status"] == "retrying"
+        assert store.hashes["task:t2"]["error"] == "model busy"
+        assert "task:t2" not in store.ttls
+
+    def test_task_fails_after_last_retry(self, store):
+        """Test that the final failed attempt is recorded and expires."""
+        _FakeOrchestrator.error = RuntimeError("model busy")
+        with pytest.raises(RuntimeError, match="model busy"):
+            tasks._run_blueprint_task(_FakeTask(retries=3), "t3", "/bp.yaml")
+        assert store.hashes["task:t3"]["status"] == "failed"
+        assert store.ttls["task:t3"] == tasks.TASK_STATE_TTL
+
+    def test_task_missing_blueprint_fails_without_retry(self, store):
+        """Test that a missing blueprint fails at once."""
+        _FakeOrchestrator.error = FileNotFoundError("Blueprint not found: x")
+        with pytest.raises(FileNotFoundError):
+            tasks._run_blueprint_task(_FakeTask(retries=0), "t4", "x.yaml")
+        assert store.hashes["task:t4"]["status"] == "failed"
+
+    def test_submit_sends_absolute_path(self, store, monkeypatch, tmp_path):
+        """Test that a relative blueprint path is resolved before queueing."""
+        sent = {}
+        monkeypatch.setattr(tasks, "Celery", object)
+        monkeypatch.setattr(
+            tasks,
+            "run_agent_blueprint",
+            SimpleNamespace(apply_async=lambda args, task_id: sent.update(args=args)),
+        )
+        (tmp_path / "bp.yaml").write_text("goal: {}\n")
+        monkeypatch.chdir(tmp_path)
+
+        task_id = tasks.submit_blueprint("bp.yaml")
+        assert sent["args"] == (task_id, str(tmp_path / "bp.yaml"))
+        assert store.hashes[f"task:{task_id}"]["status"] == "queued"
@@ -0,0 +1,326 @@
+import argparse
+import importlib.util
+import json
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+RUN_TESTS = Path(__file__).resolve().parents[1] / "evals/phi_encoder/run_tests.py"
+
+
+@pytest.fixture(scope="module")
+def harness():
+    """Load the eval harness script as a module."""
+    spec = importlib.util.spec_from_file_location("phi_encoder_run_tests", RUN_TESTS)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        sys.modules.pop(spec.name, None)
+
+
+def _python(code):
+    return [sys.executable, "-c", code]
+
+
+class TestRunCapped:
+    """Test suite for the output-capped command runner."""
+
+    def test_output_under_cap(self, harness):
+        """Test that a short run keeps all its output."""
+        proc, capped = harness._run_capped(
+            _python("import sys; print('hello'); print('oops', file=sys.stderr)"),
+            timeout=30,
+            max_bytes=1024,
+        )
+        assert not capped
+        assert proc.returncode == 0
+        assert proc.stdout.strip() == "hello"
+        assert proc.stderr.strip() == "oops"
+
+    def test_output_over_cap(self, harness):
+        """Test that a runaway run is killed and its stdout truncated."""
+        proc, capped = harness._run_capped(
+            _python("import sys\nwhile True: sys.stdout.write('x' * 4096)"),
+            timeout=30,
+            max_bytes=10000,
+        )
+        assert capped
+        assert proc.stdout == "x" * 10000
+
+    def test_timeout(self, harness):
+        """Test that a hung run raises TimeoutExpired and is killed."""
+        with pytest.raises(subprocess.TimeoutExpired) as excinfo:
+            harness._run_capped(
+                _python("import time; time.sleep(30)"), timeout=0.5, max_bytes=1024
+            )
+        assert excinfo.value.timeout == 0.5
+
+    def test_pipes_held_by_grandchild(self, harness):
+        """Test that a grandchild keeping stderr open neither hangs nor errors."""
+        code = (
+            "import subprocess, sys; "
+            "subprocess.Popen([sys.executable, '-c', 'import sys, time; "
+            "time.sleep(1.5); sys.stderr.write(chr(33))'], stdout=subprocess.DEVNULL);"
+            " print('done')"
+        )
+        errors = []
+        hook = threading.excepthook
+        threading.excepthook = errors.append
+        try:
+            proc, capped = harness._run_capped(
+                _python(code), timeout=30, max_bytes=1024
+            )
+            # Let the lingering stderr reader reach EOF
+            time.sleep(2.5)
+        finally:
+            threading.excepthook = hook
+        assert not capped
+        assert proc.stdout.strip() == "done"
+        assert errors == []
+
+    def test_non_zero_exit(self, harness):
+        """Test that a failing run reports its exit code and stderr."""
+        proc, capped = harness._run_capped(
+            _python("import sys; sys.exit('boom')"), timeout=30, max_bytes=1024
+        )
+        assert not capped
+        assert proc.returncode == 1
+        assert proc.stderr.strip() == "boom"
+
+
+class TestRunPhiCommand:
+    """Test suite for running the model through --command-template."""
+
+    @staticmethod
+    def _args(code, timeout=30, max_output_bytes=1024):
+        template = " ".join(shlex.quote(token) for token in _python(code))
+        return argparse.Namespace(
+            dry_run=False,
+            command_template=template,
+            timeout=timeout,
+            max_output_bytes=max_output_bytes,
+            n_predict=32,
+            temperature=0.3,
+        )
+
+    def test_output_over_cap_is_noted(self, harness):
+        """Test that a capped run keeps its truncated output with a note."""
+        args = self._args("print('y' * 5000)", max_output_bytes=100)
+        output, notes = harness._run_phi("prompt", args)
+        assert output == "y" * 100
+        assert notes == ["output_capped:100B"]
+
+    def test_timeout_is_noted(self, harness):
+        """Test that a hung run is reported as a timeout."""
+        args = self._args("import time; time.sleep(30)", timeout=0.5)
+        assert harness._run_phi("prompt", args) == ("", ["invocation_timeout:0.5s"])
+
+    def test_non_zero_exit_is_noted(self, harness):
+        """Test that a failing run is reported with its stderr."""
+        args = self._args("import sys; sys.exit('boom')")
+        assert harness._run_phi("prompt", args) == ("", ["command_failed: boom"])
+
+
+class _StubLlamaServer(ThreadingHTTPServer):
+    """Answers /completion with a canned status and JSON body."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _StubLlamaHandler)
+        self.requests = []
+        self.status = 200
+        self.reply = {"content": ""}
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _StubLlamaHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        self.server.requests.append(
+            (self.path, self.headers["Content-Type"], self.rfile.read(length))
+        )
+        body = json.dumps(self.server.reply).encode("utf-8")
+        self.send_response(self.server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def llama_server():
+    """Run a stub llama-server on a free local port."""
+    server = _StubLlamaServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestRunPhiServer:
+    """Test suite for completing prompts against llama-server."""
+
+    @staticmethod
+    def _args(server_url, timeout=30):
+        return argparse.Namespace(server_url=server_url, timeout=timeout)
+
+    def test_request_payload(self, harness, llama_server):
+        """Test that the prompt and sampling settings are posted as JSON."""
+        harness._run_phi_server(
+            "Encode this", "Encode this", self._args(llama_server.url + "/"), 64, 0.2
+        )
+        [(path, content_type, body)] = llama_server.requests
+        assert path == "/completion"
+        assert content_type == "application/json"
+        assert json.loads(body) == {
+            "prompt": "Encode this",
+            "n_predict": 64,
+            "temperature": 0.2,
+            "cache_prompt": True,
+        }
+
+    def test_reply_content_is_returned(self, harness, llama_server):
+        """Test that the reply content is returned with the prompt echo trimmed."""
+        llama_server.reply = {"content": 'Encode this {"a": 1}'}
+        output, notes = harness._run_phi_server(
+            "Encode this", "Encode this", self._args(llama_server.url), 64, 0.2
+        )
+        assert output == '{"a": 1}'
+        assert notes == ["prompt_echo_trimmed"]
+
+    def test_missing_content_is_empty(self, harness, llama_server):
+        """Test that a reply without content yields empty output."""
+        llama_server.reply = {}
+        output, _ = harness._run_phi_server(
+            "Encode this", "Encode this", self._args(llama_server.url), 64, 0.2
+        )
+        assert output == ""
+
+    def test_http_error_is_noted(self, harness, llama_server):
+        """Test that an HTTP error status is reported as a llama failure."""
+        llama_server.status = 503
+        llama_server.reply = {"error": "loading model"}
+        assert harness._run_phi_server(
+            "Encode this", "Encode this", self._args(llama_server.url), 64, 0.2
+        ) == ("", ["llama_failed: HTTP 503"])
+
+    def test_unreachable_server_is_noted(self, harness, llama_server):
+        """Test that a refused connection is reported as an invocation error."""
+        url = llama_server.url
+        llama_server.shutdown()
+        llama_server.server_close()
+        output, notes = harness._run_phi_server(
+            "Encode this", "Encode this", self._args(url), 64, 0.2
+        )
+        assert output == ""
+        assert notes[0].startswith("invocation_error: ")
+
+
+class TestExecutors:
+    """Test suite for the --executor choice."""
+
+    @staticmethod
+    def _run(tmp_path, executor):
+        out = tmp_path / f"{executor}.json"
+        subprocess.run(
+            [
+                sys.executable,
+                str(RUN_TESTS),
+                "--inputs",
+                str(RUN_TESTS.parent / "test_inputs/cases.json"),
+                "--schema",
+                str(RUN_TESTS.parent / "schema.json"),
+                "--out",
+                str(out),
+                "--diagnosis",
+                str(tmp_path / f"{executor}.md"),
+                "--dry-run",
+                "--executor",
+                executor,
+                "--max-workers",
+                "2",
+            ],
+            cwd=RUN_TESTS.parents[2],
+            check=True,
+            capture_output=True,
+        )
+        results = json.loads(out.read_text(encoding="utf-8"))
+        results.pop("generated_at")
+        return results
+
+    def test_thread_and_process_agree(self, tmp_path):
+        """Test that both executors produce the same summary and cases."""
+        threaded = self._run(tmp_path, "thread")
+        pooled = self._run(tmp_path, "process")
+        assert threaded["summary"]["total_cases"] > 0
+        assert threaded["summary"] == pooled["summary"]
+        assert threaded["cases"] == pooled["cases"]
+
+
+class TestExtractJsonBlob:
+    """Test suite for pulling the payload object out of model output."""
+
+    def test_object_after_prose(self, harness):
+        """Test that prose around a complete object is skipped."""
+        text = 'Sure: {"a": 1} Hope that helps.'
+        assert harness._extract_json_blob(text) == {"a": 1}
+
+    def test_invalid_braces_before_object(self, harness):
+        """Test that a balanced non-JSON brace span before the object is skipped."""
+        assert harness._extract_json_blob('use {x} here: {"a": 1}') == {"a": 1}
+
+    def test_truncated_object_with_complete_nested_object(self, harness):
+        """Test that a cut-off object does not yield one of its nested objects."""
+        text = '{"beat": {"id": 1, "tone": "calm"}, "characters": ["Ana", "Bo'
+        assert harness._extract_json_blob(text) is None
+
+    def test_truncated_object_followed_by_prose(self, harness):
+        """Test that an object that never closes is rejected despite later text."""
+        text = '{"beat": {"id": 1}, "characters": [ ...output limit reached'
+        assert harness._extract_json_blob(text) is None
+
+
+class TestPromptForCase:
+    """Test suite for filling the prompt template."""
+
+    TEMPLATE = "Rules.\nCharacters: {CANON_CHARACTERS}\nFacts: {CANON_FACTS}\n{INPUT}"
+
+    def _prompt(self, harness, **case):
+        prompt, _ = harness._prompt_for_case(
+            {"input": "Go.", **case}, {}, prompt_template=self.TEMPLATE
+        )
+        return prompt
+
+    def test_canon_lists_are_encoded(self, harness):
+        """Test that canon lists are filled in as JSON arrays."""
+        prompt = self._prompt(harness, canon_characters=["Ana"], canon_facts=[])
+        assert 'Characters: ["Ana"]\nFacts: []' in prompt
+
+    def test_string_canon_is_not_split(self, harness):
+        """Test that a string canon value is encoded whole, not per character."""
+        prompt = self._prompt(harness, canon_characters="Ana", canon_facts=[])
+        assert 'Characters: "Ana"' in prompt
+
+    def test_equal_hashing_values_do_not_share_a_fill(self, harness):
+        """Test that canon values such as True and 1 each get their own fill."""
+        first = self._prompt(harness, canon_characters=[True], canon_facts=[])
+        second = self._prompt(harness, canon_characters=[1], canon_facts=[])
+        assert "Characters: [true]" in first
+        assert "Characters: [1]" in second